@@ -5,6 +5,7 @@ from rest_framework import response, status, views, permissions
 from rest_framework.pagination import LimitOffsetPagination
 
 from apps.announcements_main.models import Announcement
+from .conditional import ConditionalGetMixin
 from .filters import AnnouncementFilter
 from .serializers import (
     AnnouncementFullContentSerializer,
@@ -27,10 +28,13 @@ class AnnouncementLimitOffsetPagination(LimitOffsetPagination):
 
 # -------------------- HOME --------------------
 
-class HomeDataContentApiView(views.APIView):
+class HomeDataContentApiView(ConditionalGetMixin, views.APIView):
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
 
+    def get_validators(self, request):
+        return [Announcement.objects.all()]
+
     def get_queryset(self, announcement_type):
         return (
             Announcement.objects.filter(announcement_type=announcement_type)
@@ -54,10 +58,13 @@ class HomeDataContentApiView(views.APIView):
         return response.Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class HomeAnnouncementsApiView(views.APIView):
+class HomeAnnouncementsApiView(ConditionalGetMixin, views.APIView):
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
 
+    def get_validators(self, request):
+        return [Announcement.objects.all()]
+
     def get(self, request):
         type_map = {"work": "work_announcement", "service": "service_announcement"}
         db_type = type_map.get(request.GET.get("announcement_type"))
@@ -72,10 +79,17 @@ class HomeAnnouncementsApiView(views.APIView):
 
 # -------------------- ANNOUNCEMENT DETAIL --------------------
 
-class AnnouncementContentApiView(views.APIView):
+class AnnouncementContentApiView(ConditionalGetMixin, views.APIView):
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
 
+    def get_validators(self, request, meta):
+        return [
+            Announcement.objects.filter(
+                announcement_type__in=Announcement.objects.filter(meta=meta).values("announcement_type")
+            )
+        ]
+
     def get(self, request, meta):
         announcement = get_object_or_404(Announcement.objects.select_related("user"), meta=meta)
         related_announcements = (
@@ -90,10 +104,13 @@ class AnnouncementContentApiView(views.APIView):
         return response.Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class MessageAnnouncementContentApiView(views.APIView):
+class MessageAnnouncementContentApiView(ConditionalGetMixin, views.APIView):
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
 
+    def get_validators(self, request, guid):
+        return [Announcement.objects.filter(guid=guid)]
+
     def get(self, request, guid):
         announcement = get_object_or_404(Announcement, guid=guid)
         serializer = LeastAnnouncementSerializer(announcement)
@@ -214,10 +231,13 @@ class WebsearchApiView(views.APIView):
 
 # -------------------- ANNOUNCEMENT DATA (for microservice) --------------------
 
-class AnnouncementDataView(views.APIView):
+class AnnouncementDataView(ConditionalGetMixin, views.APIView):
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
 
+    def get_validators(self, request, guid, *args, **kwargs):
+        return [Announcement.objects.filter(guid=guid)]
+
     def get(self, request, guid, *args, **kwargs):
         announcement = get_object_or_404(Announcement, guid=guid)
         serializer = AnnouncementDataSerializer(announcement)
@@ -0,0 +1,108 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db.models import Count, Max, QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+# Bumped whenever flushed hit counts change the "views" shown in list payloads.
+HITS_VERSION_KEY = "conditional:hits:version"
+
+
+def _seed():
+    # A fresh key never restarts at a number an evicted key already handed out.
+    return time.time_ns()
+
+
+def get_version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _seed(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """Invalidate every validator built from ``key``."""
+    cache.add(key, _seed(), timeout=None)
+    cache.incr(key)
+
+
+class NotModified(Exception):
+    def __init__(self, response):
+        super().__init__("Not modified")
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET/HEAD with 304 Not Modified before the handler (and its serializer) runs.
+
+    The check runs after DRF's ``initial()``, so authentication, permissions and
+    throttling still apply. Views return their validator sources from
+    ``get_validators``: querysets are reduced to ``COUNT(*)`` and
+    ``MAX(updated_at)`` in one aggregate query each, strings are read as cache
+    version keys (see ``bump_version``).
+    """
+
+    conditional_state = None
+
+    def get_validators(self, request, *args, **kwargs):
+        return []
+
+    def get_conditional_state(self, request, *args, **kwargs):
+        parts = []
+        last_modified = None
+        has_versions = False
+
+        for source in self.get_validators(request, *args, **kwargs):
+            if isinstance(source, QuerySet):
+                state = source.order_by().aggregate(count=Count("pk"), last=Max("updated_at"))
+                parts.append(f"{state['count']}:{state['last'].isoformat() if state['last'] else ''}")
+                if state["last"] and (last_modified is None or state["last"] > last_modified):
+                    last_modified = state["last"]
+            else:
+                has_versions = True
+                parts.append(f"{source}={get_version(source)}")
+
+        if not parts:
+            return None, None
+
+        # The same sources back every page and filter of a view, so the URL keeps their ETags apart.
+        parts.insert(0, request.get_full_path())
+        etag = quote_etag(hashlib.md5("|".join(parts).encode()).hexdigest())
+        # Version keys carry no timestamp, so Last-Modified alone could not detect their changes.
+        if has_versions:
+            last_modified = None
+        return etag, last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        etag, last_modified = self.get_conditional_state(request, *args, **kwargs)
+        self.conditional_state = (etag, last_modified)
+        timestamp = last_modified.timestamp() if last_modified else None
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            if etag:
+                not_modified.headers["ETag"] = etag
+            raise NotModified(not_modified)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.conditional_state and response.status_code == 200:
+            etag, last_modified = self.conditional_state
+            if etag:
+                response.headers.setdefault("ETag", etag)
+            if last_modified:
+                response.headers.setdefault("Last-Modified", http_date(last_modified.timestamp()))
+        return response
@@ -34,6 +34,8 @@ class CoursesListSerializer(serializers.ModelSerializer):
         fields = ["guid", "author", "title", "category", "meta", "short_description", "thumbnail", "views", "created_at"]
 
     def get_views(self, obj):
+        if hasattr(obj, "views_count"):
+            return obj.views_count
         return get_hitcount_model().objects.get_for_object(obj).hits
 
 
@@ -54,6 +56,8 @@ class CourseDetailSerializer(serializers.ModelSerializer):
         fields = ["guid", "author", "title", "category", "meta", "thumbnail", "description", "views", "lessons", "created_at"]
 
     def get_views(self, obj):
+        if hasattr(obj, "views_count"):
+            return obj.views_count
         return get_hitcount_model().objects.get_for_object(obj).hits
 
     def get_lessons(self, obj):
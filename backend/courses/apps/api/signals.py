@@ -0,0 +1,10 @@
+from django.dispatch import receiver
+
+from apps.tracking.signals import hits_flushed
+
+from .conditional import HITS_VERSION_KEY, bump_version
+
+
+@receiver(hits_flushed)
+def invalidate_views_on_hits(sender, **kwargs):
+    bump_version(HITS_VERSION_KEY)
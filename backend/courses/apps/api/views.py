@@ -1,6 +1,5 @@
 from datetime import timedelta
 
-from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from django.utils import timezone
 from django.utils.decorators import method_decorator
@@ -9,8 +8,10 @@ from rest_framework import pagination, response, status, views
 from rest_framework.pagination import LimitOffsetPagination
 
 from apps.courses_main.models import Category, Course, Lesson
-from apps.tracking.models import CustomHitCount
+from apps.tracking.counter import pending_hits, record_hit
+from apps.tracking.utils import with_views
 
+from .conditional import HITS_VERSION_KEY, ConditionalGetMixin
 from .filters import CategoryFilter, CourseFilter
 from .serializers import (
     CourseDetailSerializer,
@@ -46,10 +47,13 @@ class CourseLimitOffsetPagination(LimitOffsetPagination):
 
 
 # -------------------- HOME --------------------
-class HomeDataContentApiView(views.APIView):
+class HomeDataContentApiView(ConditionalGetMixin, views.APIView):
     authentication_classes = []
     permission_classes = []
 
+    def get_validators(self, request):
+        return [Category.objects.all(), Course.objects.all(), HITS_VERSION_KEY]
+
     def get(self, request):
         categories = Category.objects.values("guid", "title", "meta").all()
 
@@ -75,20 +79,27 @@ class HomeDataContentApiView(views.APIView):
 
 
 # -------------------- CATEGORIES --------------------
-class CategoriesApiView(views.APIView):
+class CategoriesApiView(ConditionalGetMixin, views.APIView):
     authentication_classes = []
     permission_classes = []
 
+    def get_validators(self, request):
+        return [Category.objects.all()]
+
     def get(self, request):
         categories = Category.objects.values("guid", "title", "meta").all()
         return response.Response(list(categories), status=status.HTTP_200_OK)
 
 
 # -------------------- CATEGORY CONTENT --------------------
-class CategoryContentApiView(views.APIView):
+class CategoryContentApiView(ConditionalGetMixin, views.APIView):
     authentication_classes = []
     permission_classes = []
 
+    def get_validators(self, request, meta):
+        courses = Course.objects.all() if meta == "all" else Course.objects.filter(category__meta=meta)
+        return [courses, HITS_VERSION_KEY]
+
     def get(self, request, meta):
         try:
             if meta != "all":
@@ -112,24 +123,18 @@ class CourseDetailApiView(views.APIView):
 
     def get(self, request, meta):
         try:
-            course = Course.objects.select_related("category").get(meta=meta)
+            course = with_views(Course.objects.select_related("author", "category")).get(meta=meta)
         except Course.DoesNotExist:
             return response.Response({"error": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
 
         self.count_hit(request, course)
+        course.views_count += pending_hits(course)
+
         serializer = CourseDetailSerializer(course)
         return response.Response(serializer.data, status=status.HTTP_200_OK)
 
     def count_hit(self, request, obj):
-        ip = self.get_client_ip(request)
-        content_type = ContentType.objects.get_for_model(obj.__class__)
-        with transaction.atomic():
-            hit_count, _ = CustomHitCount.objects.get_or_create(
-                content_type=content_type, object_pk=obj.pk
-            )
-            if not hit_count.hit_set.filter(ip=ip).exists():
-                hit_count.increase()
-                hit_count.hit_set.create(ip=ip)
+        record_hit(obj, self.get_client_ip(request))
 
     def get_client_ip(self, request):
         x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
@@ -139,10 +144,13 @@ class CourseDetailApiView(views.APIView):
 
 
 # -------------------- LESSON DETAIL --------------------
-class LessonDetailApiView(views.APIView):
+class LessonDetailApiView(ConditionalGetMixin, views.APIView):
     authentication_classes = []
     permission_classes = []
 
+    def get_validators(self, request, guid):
+        return [Lesson.objects.filter(guid=guid)]
+
     def get(self, request, guid):
         try:
             lesson = Lesson.objects.select_related("course", "course__category").get(guid=guid)
@@ -292,10 +300,13 @@ class TopCoursesApiView(views.APIView):
 
 
 # -------------------- NEW COURSES --------------------
-class NewCoursesApiView(views.APIView):
+class NewCoursesApiView(ConditionalGetMixin, views.APIView):
     authentication_classes = []
     permission_classes = []
 
+    def get_validators(self, request):
+        return [Course.objects.all(), HITS_VERSION_KEY]
+
     def get(self, request):
         queryset = Course.objects.select_related("category").order_by("-created_at")
         paginator = CustomPageNumberPagination()
@@ -0,0 +1,9 @@
+from apps.courses_main.management.base import IntervalCommand
+from apps.tracking.counter import flush_hits
+
+
+class Command(IntervalCommand):
+    help = "Flush view counters buffered in Redis into hitcount_custom_hit_count"
+
+    def run_once(self):
+        return f"Flushed hits for {len(flush_hits())} objects"
@@ -1,3 +1,3 @@
-from .tracking_model import CustomHitCount
+from .tracking_model import CustomHitCount, HitFlushBatch
 
 # Create your models here.
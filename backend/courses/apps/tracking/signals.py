@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent by flush_hits after a batch is written, with ``hits`` mapping
+# (content_type_id, object_pk) to the number of new hits for that object.
+hits_flushed = Signal()
@@ -9,3 +9,13 @@ class CustomHitCount(HitCount):
 
     class Meta:
         db_table = "hitcount_custom_hit_count"
+
+
+class HitFlushBatch(models.Model):
+    """Marks a Redis hit batch as applied, written in the same transaction as its counts."""
+
+    batch_id = models.CharField(max_length=32, unique=True)
+    applied_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = "hitcount_flush_batches"
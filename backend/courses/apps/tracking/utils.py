@@ -0,0 +1,16 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Cast, Coalesce
+
+from .tracking_model import CustomHitCount
+
+
+def with_views(queryset, field_name="views_count"):
+    """Annotate hit totals onto a queryset with one correlated subquery instead of a lookup per row."""
+    content_type = ContentType.objects.get_for_model(queryset.model)
+    hits = CustomHitCount.objects.filter(
+        content_type=content_type,
+        object_pk=Cast(OuterRef("pk"), output_field=models.CharField()),
+    ).values("hits")[:1]
+    return queryset.annotate(**{field_name: Coalesce(Subquery(hits), 0, output_field=models.BigIntegerField())})
@@ -2,6 +2,7 @@ from django.db.models import Q
 
 import django_filters
 
+from apps.news_main import search
 from apps.news_main.models import Category, DocumentsModel, NewsModel
 
 
@@ -26,6 +27,8 @@ class NewsModelFilter(django_filters.FilterSet):
     category = django_filters.CharFilter(field_name="category__title", lookup_expr="icontains")
 
     def search(self, queryset, name, value):
+        if search.is_supported():
+            return search.search_news(queryset, value)
         return queryset.filter(
             Q(title__icontains=value)
             | Q(short_description__icontains=value)
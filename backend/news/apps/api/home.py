@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.news_main.conditional import bump_version
+from apps.news_main.models import Category, NewsModel
+from apps.news_main.trending import order_by_trending
+from apps.tracking.utils import with_views
+
+from .serializers import FullLoadContentSerializer
+
+HOME_CACHE_KEY = "news:home:snapshot"
+HOME_VERSION_KEY = "news:home:version"
+# Counts content changes; HOME_BUILT_KEY holds the count the current snapshot was built at.
+HOME_DIRTY_KEY = "news:home:dirty"
+HOME_BUILT_KEY = "news:home:built"
+HOME_REBUILD_LOCK_KEY = "news:home:rebuilding"
+# Frees the lock if the builder dies mid-rebuild.
+HOME_REBUILD_LOCK_TIMEOUT = 60
+
+
+def build_home_payload():
+    categories = Category.objects.all()
+
+    news = list(with_views(NewsModel.objects.select_related("user", "category")).order_by("-created_at")[:16])
+
+    one_week_ago = timezone.now() - timedelta(days=7)
+    week_news = list(
+        order_by_trending(
+            with_views(NewsModel.objects.select_related("user", "category").filter(created_at__gte=one_week_ago))
+        )[:8]
+    )
+
+    if len(week_news) < 8:
+        extra_needed = 8 - len(week_news)
+        recent_fallback = [n for n in news if n not in week_news][:extra_needed]
+        week_news.extend(recent_fallback)
+
+    serializer = FullLoadContentSerializer(
+        {
+            "categories": categories,
+            "banner": news[:5],
+            "week": week_news,
+        }
+    )
+    return serializer.data
+
+
+def rebuild_home_snapshot():
+    """Render the home payload once and store it as a ready-to-send JSON document."""
+    snapshot = JSONRenderer().render(build_home_payload())
+    cache.set(HOME_CACHE_KEY, snapshot, timeout=None)
+    bump_version(HOME_VERSION_KEY)
+    return snapshot
+
+
+def get_home_snapshot():
+    snapshot = cache.get(HOME_CACHE_KEY)
+    if snapshot is None:
+        snapshot = rebuild_home_snapshot()
+    return snapshot
+
+
+def mark_home_dirty():
+    cache.add(HOME_DIRTY_KEY, 0, timeout=None)
+    cache.incr(HOME_DIRTY_KEY)
+
+
+def schedule_home_rebuild():
+    """Mark the snapshot stale once the current transaction commits; ``build_home`` rebuilds it."""
+    transaction.on_commit(mark_home_dirty)
+
+
+def rebuild_dirty_home():
+    """
+    Rebuild the snapshot if it was marked stale since the last build.
+
+    Returns ``True`` when a rebuild ran. The change counter read before the
+    build is only recorded as built after the build succeeds, so a failure or
+    a save landing mid-rebuild leaves the snapshot stale for the next run.
+    """
+    changes = cache.get(HOME_DIRTY_KEY)
+    if not changes or changes == cache.get(HOME_BUILT_KEY):
+        return False
+    if not cache.add(HOME_REBUILD_LOCK_KEY, 1, timeout=HOME_REBUILD_LOCK_TIMEOUT):
+        return False
+
+    try:
+        rebuild_home_snapshot()
+        cache.set(HOME_BUILT_KEY, changes, timeout=None)
+    finally:
+        cache.delete(HOME_REBUILD_LOCK_KEY)
+    return True
@@ -0,0 +1,9 @@
+from apps.api.home import rebuild_dirty_home
+from apps.news_main.management.base import IntervalCommand
+
+
+class Command(IntervalCommand):
+    help = "Rebuild the cached home snapshot when content, hits or the trending ranking changed"
+
+    def run_once(self):
+        return "Rebuilt home snapshot" if rebuild_dirty_home() else "Home snapshot is up to date"
@@ -3,6 +3,7 @@ from rest_framework import serializers
 from hitcount.utils import get_hitcount_model
 
 from apps.news_main.models import Category, DocumentsModel, NewsModel
+from apps.news_main.thumbnails import srcset
 from apps.users.models import UserModel
 
 
@@ -27,12 +28,28 @@ class SimpleUserSerializer(serializers.ModelSerializer):
 class NewsListSerializer(serializers.ModelSerializer):
     views = serializers.SerializerMethodField()
     category = SimpleCategorySerializer()
+    thumbnail_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = NewsModel
-        fields = ["guid", "title", "category", "meta", "short_description", "thumbnail", "views", "created_at"]
+        fields = [
+            "guid",
+            "title",
+            "category",
+            "meta",
+            "short_description",
+            "thumbnail",
+            "thumbnail_srcset",
+            "views",
+            "created_at",
+        ]
+
+    def get_thumbnail_srcset(self, obj):
+        return srcset(obj)
 
     def get_views(self, obj):
+        if hasattr(obj, "views_count"):
+            return obj.views_count
         return get_hitcount_model().objects.get_for_object(obj).hits
 
 
@@ -57,6 +74,8 @@ class NewsDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_views(self, obj):
+        if hasattr(obj, "views_count"):
+            return obj.views_count
         return get_hitcount_model().objects.get_for_object(obj).hits
 
 
@@ -75,9 +94,10 @@ class FullLoadContentSerializer(serializers.Serializer):
     categories = CategorySerializer(many=True)
     banner = NewsListSerializer(many=True)
     week = NewsListSerializer(many=True)
-    documents = FullDocumentsSerializer()
+    documents = FullDocumentsSerializer(required=False)
 
 
 class SearchResultSerializer(serializers.Serializer):
     meta = serializers.CharField()
     title = serializers.CharField()
+    headline = serializers.CharField(required=False)
@@ -0,0 +1,35 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.news_main.conditional import HITS_VERSION_KEY, bump_version
+from apps.news_main.models import Category, NewsModel
+from apps.news_main.thumbnails import variants_built
+from apps.news_main.trending import trending_ranked
+from apps.tracking.signals import hits_flushed
+
+from .home import schedule_home_rebuild
+
+
+@receiver(post_save, sender=NewsModel)
+@receiver(post_delete, sender=NewsModel)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(variants_built)
+def rebuild_home_on_content_change(sender, **kwargs):
+    schedule_home_rebuild()
+
+
+@receiver(hits_flushed)
+def rebuild_home_on_hits(sender, hits, **kwargs):
+    bump_version(HITS_VERSION_KEY)
+
+    news_type = ContentType.objects.get_for_model(NewsModel)
+    if any(content_type_id == news_type.pk for content_type_id, _ in hits):
+        schedule_home_rebuild()
+
+
+@receiver(trending_ranked)
+def rebuild_home_on_ranking(sender, **kwargs):
+    # The home "week" rail is read from the ranking.
+    schedule_home_rebuild()
@@ -1,3 +1,58 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
+from django_redis import get_redis_connection
+
+from apps.news_main.models import Category, NewsModel
+from apps.users.models import UserModel
+
+from .home import HOME_CACHE_KEY, HOME_REBUILD_LOCK_KEY, rebuild_dirty_home
+
+
+class HomeSnapshotTests(TestCase):
+    def setUp(self):
+        get_redis_connection("default").flushdb()
+        cache.clear()
+        self.user = UserModel.objects.create(username="author", first_name="A", last_name="B")
+        self.category = Category.objects.create(title="Sport", meta="sport", state="approved")
+
+    def create_news(self, meta):
+        with self.captureOnCommitCallbacks(execute=True):
+            return NewsModel.objects.create(
+                category=self.category,
+                user=self.user,
+                title=meta,
+                meta=meta,
+                short_description="s",
+                description="d",
+                state="approved",
+            )
+
+    def test_cold_cache_etag_matches_the_snapshot(self):
+        etag = self.client.get("/api/home-data/").headers["ETag"]
+        response = self.client.get("/api/home-data/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_saves_only_mark_the_snapshot_dirty(self):
+        self.client.get("/api/home-data/")
+        snapshot = cache.get(HOME_CACHE_KEY)
+
+        self.create_news("futbol")
+        self.assertEqual(cache.get(HOME_CACHE_KEY), snapshot)
+
+        call_command("build_home", stdout=mock.MagicMock())
+        self.assertIn(b"futbol", cache.get(HOME_CACHE_KEY))
+        self.assertFalse(rebuild_dirty_home())
+
+    def test_failed_rebuild_stays_dirty_and_releases_the_lock(self):
+        self.create_news("futbol")
+
+        with mock.patch("apps.api.home.rebuild_home_snapshot", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                rebuild_dirty_home()
+        self.assertIsNone(cache.get(HOME_REBUILD_LOCK_KEY))
 
-# Create your tests here.
+        self.assertTrue(rebuild_dirty_home())
+        self.assertIn(b"futbol", cache.get(HOME_CACHE_KEY))
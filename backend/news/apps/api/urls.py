@@ -1,8 +1,12 @@
 from django.urls import include, path
 
+from .views import HomeDataContentApiView, WebsearchApiView
+
 app_name = "api"
 
 urlpatterns = [
+    path("home-data/", HomeDataContentApiView.as_view(), name="home-data"),
+    path("search/", WebsearchApiView.as_view(), name="websearch"),
     path("", include("apps.news_main.urls", "news_main"), name="news-main"),
     path("dashboard/", include("apps.dashboard.urls")),
 ]
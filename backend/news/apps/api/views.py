@@ -1,80 +1,42 @@
-from datetime import timedelta
-
-from django.contrib.contenttypes.models import ContentType
-from django.utils import timezone
+from django.http import HttpResponse
 from rest_framework import response, status, views
-from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination
+from rest_framework.pagination import LimitOffsetPagination
 
+from apps.news_main import search
+from apps.news_main.conditional import ConditionalGetMixin
 from apps.news_main.models import Category, DocumentsModel, NewsModel
-from apps.tracking.models import CustomHitCount
 
 from .filters import NewsCategoryFilter, NewsModelFilter
+from .home import HOME_VERSION_KEY, get_home_snapshot
 from .serializers import *
 
 # Create your views here.
 
 
-class CustomPageNumberPagination(PageNumberPagination):
-    def get_page_number(self, request, paginator):
-        return request.data.get("page_number", 1)
-
-
-class HomeDataContentApiView(views.APIView):
+class HomeDataContentApiView(ConditionalGetMixin, views.APIView):
     authentication_classes = []
     permission_classes = []
 
-    def get(self, request):
-        categories = Category.objects.all()
+    snapshot = None
 
-        news = list(NewsModel.objects.select_related("user", "category").order_by("-created_at")[:16])
+    def initial(self, request, *args, **kwargs):
+        # Loaded first: a cold-cache build bumps HOME_VERSION_KEY, which the ETag must already include.
+        self.snapshot = get_home_snapshot()
+        super().initial(request, *args, **kwargs)
 
-        one_week_ago = timezone.now() - timedelta(days=7)
-        week_news = [item for item in news if item.created_at >= one_week_ago]
+    def get_validators(self, request):
+        return [HOME_VERSION_KEY]
 
-        if len(week_news) < 8:
-            extra_needed = 8 - len(week_news)
-            recent_fallback = [n for n in news if n not in week_news][:extra_needed]
-            week_news.extend(recent_fallback)
-
-        week_sorted = sorted(week_news, key=lambda x: x.hit_count.hits if hasattr(x, "hit_count") else 0, reverse=True)
-
-        serializer = FullLoadContentSerializer(
-            {
-                "categories": categories,
-                "banner": news[:5],
-                "week": week_sorted[:8],
-            }
-        )
-
-        return response.Response(serializer.data, status=status.HTTP_200_OK)
+    def get(self, request):
+        return HttpResponse(self.snapshot, content_type="application/json")
 
 
-class CategoryContentApiView(views.APIView):
+class CategoriesApiView(ConditionalGetMixin, views.APIView):
     authentication_classes = []
     permission_classes = []
 
-    def get(self, request, meta):
-        if meta != "all":
-            try:
-                category = Category.objects.get(meta=meta)
-            except Category.DoesNotExist:
-                return response.Response({"message": "Category not found"}, status=status.HTTP_404_NOT_FOUND)
-
-            news_list = NewsModel.objects.filter(category=category)
-        else:
-            news_list = NewsModel.objects.all()
-
-        paginator = CustomPageNumberPagination()
-        paginator.page_size = 16
-        paginated_queryset = paginator.paginate_queryset(list(news_list), request)
-        serializer = NewsListSerializer(paginated_queryset, many=True)
-
-        return paginator.get_paginated_response(serializer.data)
-
-
-class CategoriesApiView(views.APIView):
-    authentication_classes = []
-    permission_classes = []
+    def get_validators(self, request):
+        return [Category.objects.all()]
 
     def get(self, request):
         categories = Category.objects.all()
@@ -82,37 +44,6 @@ class CategoriesApiView(views.APIView):
         return response.Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class NewsDetailApiView(views.APIView):
-    authentication_classes = []
-    permission_classes = []
-
-    def get(self, request, meta):
-        try:
-            news = NewsModel.objects.get(meta=meta)
-            self.count_hit(request, news)
-        except NewsModel.DoesNotExist:
-            return response.Response({"message": "News not found"}, status=status.HTTP_404_NOT_FOUND)
-
-        serializer = NewsDetailSerializer(news)
-        return response.Response(serializer.data, status=status.HTTP_200_OK)
-
-    def count_hit(self, request, obj):
-        content_type = ContentType.objects.get_for_model(obj)
-        hit_count, _ = CustomHitCount.objects.get_or_create(content_type=content_type, object_pk=obj.pk)
-
-        ip = self.get_client_ip(request)
-        if not hit_count.hit_set.filter(ip=ip).exists():
-            hit_count.increase()
-            hit_count.hit_set.create(ip=ip)
-            hit_count.save()
-
-    def get_client_ip(self, request):
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            return x_forwarded_for.split(",")[0]
-        return request.META.get("REMOTE_ADDR")
-
-
 class LoadDocumentsApiView(views.APIView):
     def get(self, request, type):
         return response.Response(DocumentsSerializer(DocumentsModel.objects.filter(doc_type=type)).data)
@@ -143,19 +74,29 @@ class WebsearchApiView(views.APIView):
     def get(self, request):
         q = request.GET.get("q", "")
 
-        category_qs = NewsCategoryFilter(request.GET, queryset=Category.objects.all()).qs
+        if q and search.is_supported():
+            results = search.search_all(q)
+            # The ranked querysets already apply ``q``; the remaining filters narrow them.
+            filters = request.GET.copy()
+            filters.pop("q", None)
+            category_qs = NewsCategoryFilter(filters, queryset=results["categories"]).qs
+            news_qs = NewsModelFilter(filters, queryset=results["news"].select_related("user")).qs
+            doc_qs = results["documents"]
+        else:
+            category_qs = NewsCategoryFilter(request.GET, queryset=Category.objects.all()).qs
+            news_qs = NewsModelFilter(request.GET, queryset=NewsModel.objects.select_related("category", "user")).qs
+            doc_qs = DocumentsModel.objects.all()
+            if q:
+                doc_qs = doc_qs.filter(title__icontains=q)
+
         category_paginator = CategoryLimitOffsetPagination()
         paginated_categories = category_paginator.paginate_queryset(category_qs, request, view=self)
         serialized_categories = SearchResultSerializer(paginated_categories, many=True).data
 
-        news_qs = NewsModelFilter(request.GET, queryset=NewsModel.objects.select_related("category", "user")).qs
         news_paginator = NewsLimitOffsetPagination()
         paginated_news = news_paginator.paginate_queryset(news_qs, request, view=self)
         serialized_news = SearchResultSerializer(paginated_news, many=True).data
 
-        doc_qs = DocumentsModel.objects.all()
-        if q:
-            doc_qs = doc_qs.filter(title__icontains=q)
         doc_paginator = DocumentLimitOffsetPagination()
         paginated_docs = doc_paginator.paginate_queryset(doc_qs, request, view=self)
         serialized_docs = SearchResultSerializer(paginated_docs, many=True).data
@@ -1,3 +1,19 @@
 from django.db import models
 
-# Create your models here.
+
+class NewsStatisticsSnapshot(models.Model):
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    total_news = models.PositiveIntegerField(default=0)
+    total_news_views = models.BigIntegerField(default=0)
+    total_documents = models.PositiveIntegerField(default=0)
+    news_by_category = models.JSONField(default=dict)
+    documents_by_type = models.JSONField(default=dict)
+
+    def __str__(self):
+        return f"Statistics at {self.created_at:%Y-%m-%d %H:%M}"
+
+    class Meta:
+        verbose_name = "News Statistics Snapshot"
+        verbose_name_plural = "News Statistics Snapshots"
+        db_table = "news_app__statistics_snapshots"
+        ordering = ("-created_at",)
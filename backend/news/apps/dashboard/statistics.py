@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from apps.news_main.models import DocumentsModel, NewsModel
+from apps.tracking.utils import with_views
+
+from .models import NewsStatisticsSnapshot
+
+# Dashboard loads within this window share one snapshot, so the grouped news
+# and documents queries run at most once per window.
+SNAPSHOT_MAX_AGE = timedelta(minutes=5)
+
+
+def collect_news_statistics():
+    """Dashboard totals from one grouped news query and one grouped documents query."""
+    news_rows = (
+        with_views(NewsModel.objects.all())
+        .values("category__title")
+        .annotate(count=Count("pk"), views=Sum("views_count"))
+        .order_by()
+    )
+    docs_rows = DocumentsModel.objects.values("doc_type").annotate(count=Count("pk")).order_by()
+
+    news_by_category = {}
+    total_news = total_news_views = 0
+    for row in news_rows:
+        news_by_category[row["category__title"]] = row["count"]
+        total_news += row["count"]
+        total_news_views += row["views"] or 0
+
+    documents_by_type = {row["doc_type"]: row["count"] for row in docs_rows}
+
+    return {
+        "total_news": total_news,
+        "total_news_views": total_news_views,
+        "total_documents": sum(documents_by_type.values()),
+        "news_by_category": news_by_category,
+        "documents_by_type": documents_by_type,
+    }
+
+
+def take_snapshot():
+    return NewsStatisticsSnapshot.objects.create(**collect_news_statistics())
+
+
+def get_snapshot(max_age=SNAPSHOT_MAX_AGE):
+    """The latest snapshot, taking a new one when none is fresher than ``max_age``."""
+    snapshot = NewsStatisticsSnapshot.objects.first()
+    if snapshot is None or snapshot.created_at < timezone.now() - max_age:
+        snapshot = take_snapshot()
+    return snapshot
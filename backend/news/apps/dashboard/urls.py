@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import AdminCategoriesViewSet, AdminDocumentsViewSet, AdminNewsViewSet, NewsStatisticsView
+from .views import AdminCategoriesViewSet, AdminDocumentsViewSet, AdminNewsViewSet, NewsStatisticsHistoryView, NewsStatisticsView
 
 app_name = "dashboard"
 
@@ -14,5 +14,6 @@ router.register(r"documents", AdminDocumentsViewSet, basename="admin-documents")
 
 urlpatterns = [
     path("", include(router.urls), name="uAdmin123"),
-    path("statistics", NewsStatisticsView.as_view(), name="statistics")
+    path("statistics", NewsStatisticsView.as_view(), name="statistics"),
+    path("statistics/history", NewsStatisticsHistoryView.as_view(), name="statistics-history"),
 ]
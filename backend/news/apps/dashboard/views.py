@@ -1,9 +1,13 @@
+from datetime import timedelta
+
 from apps.news_main.models import Category, DocumentsModel, NewsModel
 from apps.news_main.serializers import NewsStatisticsSerializer
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status, views
-from django.db.models import Count
+from django.utils import timezone
+
+from .models import NewsStatisticsSnapshot
 
 from .serializers import (
     AdminManageCategoriesModelSerializer,
@@ -12,6 +16,7 @@ from .serializers import (
 )
 from .viewset import BaseAdminViewSet
 from .permissions import HasPermission
+from .statistics import get_snapshot
 
 
 class AdminCategoriesViewSet(BaseAdminViewSet):
@@ -81,29 +86,21 @@ class NewsStatisticsView(views.APIView):
     permission_classes = [HasPermission]
 
     def post(self, request, *args, **kwargs):
-        total_news = NewsModel.objects.count()
-        total_documents = DocumentsModel.objects.count()
-        total_news_views = sum(n.hit_count_generic.count() for n in NewsModel.objects.all())
-        news_by_category_qs = (
-            NewsModel.objects.values("category__title")
-            .annotate(count=Count("guid"))
-            .order_by()
-        )
-        news_by_category = {row["category__title"]: row["count"] for row in news_by_category_qs}
-        docs_by_type_qs = (
-            DocumentsModel.objects.values("doc_type")
-            .annotate(count=Count("guid"))
-            .order_by()
-        )
-        documents_by_type = {row["doc_type"]: row["count"] for row in docs_by_type_qs}
-
-        data = {
-            "total_news": total_news,
-            "total_news_views": total_news_views,
-            "total_documents": total_documents,
-            "news_by_category": news_by_category,
-            "documents_by_type": documents_by_type,
-        }
-
-        serializer = NewsStatisticsSerializer(data)
+        serializer = NewsStatisticsSerializer(get_snapshot())
+        return Response(serializer.data)
+
+
+class NewsStatisticsHistoryView(views.APIView):
+    permission_classes = [HasPermission]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            days = min(max(int(request.query_params.get("days", 30)), 1), 365)
+        except ValueError:
+            return Response({"detail": "days must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        snapshots = NewsStatisticsSnapshot.objects.filter(
+            created_at__gte=timezone.now() - timedelta(days=days)
+        ).order_by("created_at")
+        serializer = NewsStatisticsSerializer(snapshots, many=True)
         return Response(serializer.data)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class MainConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.news_main"
+
+    def ready(self):
+        from . import signals  # noqa: F401
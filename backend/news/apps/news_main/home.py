@@ -0,0 +1,50 @@
+from django.core.cache import cache
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from .models import Category, DocumentsModel, NewsModel
+from .serializers import CategorySerializer, DocumentsReadOnlySerializer, NewsHomeSerializer
+
+BUNDLE_VERSION_KEY = "news_main:home:version"
+BUNDLE_CACHE_KEY = "news_main:home:bundle:{version}"
+# Entries for older versions are never read again; the timeout only reclaims their memory.
+BUNDLE_TIMEOUT = 60 * 60 * 24
+BANNER_SIZE = 5
+DOCUMENTS_PER_TYPE = 5
+
+
+def latest_documents_by_type(limit=DOCUMENTS_PER_TYPE):
+    """Newest ``limit`` documents of every doc_type, fetched with one ROW_NUMBER() query."""
+    documents = DocumentsModel.objects.annotate(
+        row_number=Window(
+            RowNumber(),
+            partition_by=[F("doc_type")],
+            order_by=[F("created_at").desc(), F("guid").desc()],
+        )
+    ).filter(row_number__lte=limit)
+
+    grouped = {}
+    for document in documents.order_by("doc_type", "row_number"):
+        grouped.setdefault(document.doc_type, []).append(document)
+    return grouped
+
+
+def build_home_bundle():
+    documents = latest_documents_by_type()
+    banner = NewsModel.objects.select_related("category").order_by("-created_at")[:BANNER_SIZE]
+
+    return {
+        "banner": NewsHomeSerializer(banner, many=True).data,
+        "legacy_documents": DocumentsReadOnlySerializer(documents.get("legacy_documents", []), many=True).data,
+        "business_documents": DocumentsReadOnlySerializer(documents.get("business_documents", []), many=True).data,
+        "categories": CategorySerializer(Category.objects.all(), many=True).data,
+    }
+
+
+def get_home_bundle():
+    key = BUNDLE_CACHE_KEY.format(version=cache.get(BUNDLE_VERSION_KEY, 0))
+    bundle = cache.get(key)
+    if bundle is None:
+        bundle = build_home_bundle()
+        cache.set(key, bundle, timeout=BUNDLE_TIMEOUT)
+    return bundle
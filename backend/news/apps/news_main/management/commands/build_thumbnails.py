@@ -0,0 +1,9 @@
+from apps.news_main.management.base import IntervalCommand
+from apps.news_main.thumbnails import build_stale_variants
+
+
+class Command(IntervalCommand):
+    help = "Generate resized thumbnail variants for news whose thumbnail has none or changed"
+
+    def run_once(self):
+        return f"Thumbnail variants built for {build_stale_variants()} news"
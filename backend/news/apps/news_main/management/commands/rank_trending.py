@@ -0,0 +1,9 @@
+from apps.news_main.management.base import IntervalCommand
+from apps.news_main.trending import rank_trending
+
+
+class Command(IntervalCommand):
+    help = "Decay and update the trending news ranking kept in Redis"
+
+    def run_once(self):
+        return f"Ranked {rank_trending()} trending news"
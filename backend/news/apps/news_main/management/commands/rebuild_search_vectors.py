@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.news_main.models import Category, DocumentsModel, NewsModel
+from apps.news_main.search import is_supported, update_document_vectors, update_news_vectors
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored full-text search vectors for news and documents"
+
+    def handle(self, *args, **options):
+        if not is_supported():
+            self.stdout.write(self.style.ERROR("Full-text search requires PostgreSQL."))
+            return
+
+        for category in Category.admin_objects.all():
+            update_news_vectors(NewsModel.admin_objects.filter(category=category), category.title)
+        update_document_vectors(DocumentsModel.admin_objects.all())
+
+        self.stdout.write(self.style.SUCCESS("Search vectors rebuilt"))
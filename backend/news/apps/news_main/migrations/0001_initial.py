@@ -0,0 +1,101 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:47
+
+import apps.news_main.mixins
+import apps.news_main.utils
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+import django.db.models.deletion
+import hitcount.models
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The gin_trgm_ops indexes below need pg_trgm; a no-op on other databases.
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('title', models.CharField(max_length=200, verbose_name='Nomi')),
+                ('meta', models.SlugField(blank=True, max_length=150, unique=True, verbose_name='Slug')),
+            ],
+            options={
+                'verbose_name': 'Kategoriya',
+                'verbose_name_plural': 'Kategoriyalar',
+                'db_table': 'news_app__categories',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['title'], name='news_category_title_trgm_idx', opclasses=['gin_trgm_ops'])],
+            },
+            bases=(apps.news_main.mixins.AutoSlugMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='DocumentsModel',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('doc_type', models.CharField(choices=[('legacy_documents', 'Qonunchilik hujjatlari'), ('business_documents', 'Kichik biznes loyihalari')], max_length=32, verbose_name='Hujjat turi')),
+                ('title', models.CharField(max_length=200, verbose_name='Sarlavha')),
+                ('meta', models.SlugField(blank=True, max_length=150, unique=True, verbose_name='Slug')),
+                ('subtitle', models.CharField(max_length=300, verbose_name='Qo‘shimcha sarlavha')),
+                ('link', models.URLField(blank=True, max_length=2000, null=True, verbose_name='Havola')),
+                ('file', models.FileField(blank=True, null=True, upload_to=apps.news_main.utils.get_filename, verbose_name='Fayl')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+            ],
+            options={
+                'verbose_name': 'Hujjat',
+                'verbose_name_plural': 'Hujjatlar',
+                'db_table': 'news_app__documents',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='documents_search_vector_idx'), django.contrib.postgres.indexes.GinIndex(fields=['title'], name='documents_title_trgm_idx', opclasses=['gin_trgm_ops'])],
+            },
+            bases=(apps.news_main.mixins.AutoSlugMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='NewsModel',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('thumbnail', models.ImageField(upload_to=apps.news_main.utils.get_filename, verbose_name='Rasm')),
+                ('title', models.CharField(max_length=200, verbose_name='Sarlavha')),
+                ('meta', models.SlugField(blank=True, max_length=150, unique=True, verbose_name='Slug')),
+                ('short_description', models.TextField(max_length=500, verbose_name='Qisqa izoh')),
+                ('description', models.TextField(verbose_name='To‘liq matn')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('thumbnail_variants', models.JSONField(blank=True, default=dict, editable=False)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='category_news', to='news_main.category', verbose_name='Kategoriya')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_upload_news', to=settings.AUTH_USER_MODEL, verbose_name='Muallif')),
+            ],
+            options={
+                'verbose_name': 'Yangilik',
+                'verbose_name_plural': 'Yangiliklar',
+                'db_table': 'news_app__news',
+                'indexes': [models.Index(fields=['state', '-created_at', '-guid'], name='news_feed_idx'), models.Index(fields=['category', 'state', '-created_at', '-guid'], name='news_category_feed_idx'), django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='news_search_vector_idx'), django.contrib.postgres.indexes.GinIndex(fields=['title'], name='news_title_trgm_idx', opclasses=['gin_trgm_ops'])],
+            },
+            bases=(apps.news_main.mixins.AutoSlugMixin, models.Model, hitcount.models.HitCountMixin),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from hitcount.models import MODEL_HITCOUNT, HitCountMixin
@@ -25,6 +27,9 @@ class Category(AutoSlugMixin, BaseModel):
         db_table = "news_app__categories"
         verbose_name = "Kategoriya"
         verbose_name_plural = "Kategoriyalar"
+        indexes = [
+            GinIndex(fields=["title"], name="news_category_title_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ]
 
 
 class NewsModel(AutoSlugMixin, BaseModel, HitCountMixin):
@@ -36,6 +41,9 @@ class NewsModel(AutoSlugMixin, BaseModel, HitCountMixin):
     meta = models.SlugField(max_length=150, unique=True, verbose_name="Slug", blank=True)
     short_description = models.TextField(max_length=500, verbose_name="Qisqa izoh")
     description = models.TextField(verbose_name="To‘liq matn")
+    search_vector = SearchVectorField(null=True, editable=False)
+    # {"source": thumbnail name, "widths": {width: variant name}}, filled in by apps.news_main.thumbnails.
+    thumbnail_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     hit_count_generic = GenericRelation(MODEL_HITCOUNT, object_id_field="object_pk", related_query_name="news_views")
 
@@ -49,6 +57,12 @@ class NewsModel(AutoSlugMixin, BaseModel, HitCountMixin):
         db_table = "news_app__news"
         verbose_name = "Yangilik"
         verbose_name_plural = "Yangiliklar"
+        indexes = [
+            models.Index(fields=["state", "-created_at", "-guid"], name="news_feed_idx"),
+            models.Index(fields=["category", "state", "-created_at", "-guid"], name="news_category_feed_idx"),
+            GinIndex(fields=["search_vector"], name="news_search_vector_idx"),
+            GinIndex(fields=["title"], name="news_title_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ]
 
 
 class DocumentsModel(AutoSlugMixin, BaseModel):
@@ -65,6 +79,7 @@ class DocumentsModel(AutoSlugMixin, BaseModel):
     subtitle = models.CharField(max_length=300, verbose_name="Qo‘shimcha sarlavha")
     link = models.URLField(max_length=2000, null=True, blank=True, verbose_name="Havola")
     file = models.FileField(upload_to=get_filename, null=True, blank=True, verbose_name="Fayl")
+    search_vector = SearchVectorField(null=True, editable=False)
 
     objects = ModelManager()
     admin_objects = models.Manager()
@@ -76,3 +91,7 @@ class DocumentsModel(AutoSlugMixin, BaseModel):
         db_table = "news_app__documents"
         verbose_name = "Hujjat"
         verbose_name_plural = "Hujjatlar"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="documents_search_vector_idx"),
+            GinIndex(fields=["title"], name="documents_title_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ]
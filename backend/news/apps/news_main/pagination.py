@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class NewsCursorPagination(CursorPagination):
+    """Keyset pagination over (created_at, guid): no COUNT(*) and no OFFSET, however deep the feed is scrolled."""
+
+    page_size = 16
+    ordering = ("-created_at", "-guid")
+    page_size_query_param = "page_size"
+    max_page_size = 50
+
+    @staticmethod
+    def is_requested(request):
+        return request.query_params.get("mode") == "cursor"
@@ -0,0 +1,82 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db import connection
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce
+
+from .models import Category, DocumentsModel, NewsModel
+
+# Content is mostly Uzbek, which has no Postgres stemmer, so vectors are built without one.
+SEARCH_CONFIG = "simple"
+HEADLINE_OPTIONS = {"start_sel": "<mark>", "stop_sel": "</mark>", "max_fragments": 2}
+
+
+def is_supported():
+    return connection.vendor == "postgresql"
+
+
+def news_vector(category_title):
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Value(category_title or ""), weight="B", config=SEARCH_CONFIG)
+        + SearchVector("short_description", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def document_vector():
+    return SearchVector("title", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "subtitle", weight="B", config=SEARCH_CONFIG
+    )
+
+
+def update_news_vectors(queryset, category_title):
+    if is_supported():
+        queryset.update(search_vector=news_vector(category_title))
+
+
+def update_document_vectors(queryset):
+    if is_supported():
+        queryset.update(search_vector=document_vector())
+
+
+def _query(q):
+    return SearchQuery(q, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def _ranked(queryset, q, headline_field):
+    query = _query(q)
+    rank = Coalesce(SearchRank(F("search_vector"), query), 0.0) + TrigramSimilarity("title", q)
+    return (
+        queryset.annotate(
+            rank=rank,
+            headline=SearchHeadline(headline_field, query, config=SEARCH_CONFIG, **HEADLINE_OPTIONS),
+        )
+        .filter(Q(search_vector=query) | Q(title__trigram_similar=q))
+        .order_by("-rank", "-created_at")
+    )
+
+
+def search_news(queryset, q):
+    """Ranked full-text matches, falling back to trigram similarity on the title for typos."""
+    return _ranked(queryset, q, "short_description")
+
+
+def search_documents(queryset, q):
+    return _ranked(queryset, q, "subtitle")
+
+
+def search_categories(queryset, q):
+    return (
+        queryset.annotate(rank=TrigramSimilarity("title", q))
+        .filter(Q(title__trigram_similar=q) | Q(title__icontains=q))
+        .order_by("-rank")
+    )
+
+
+def search_all(q):
+    """News, categories and documents for one query, each ranked by relevance."""
+    return {
+        "categories": search_categories(Category.objects.all(), q),
+        "news": search_news(NewsModel.objects.select_related("category"), q),
+        "documents": search_documents(DocumentsModel.objects.all(), q),
+    }
@@ -43,6 +43,7 @@ class NewsHomeSerializer(serializers.ModelSerializer):
 
 
 class NewsStatisticsSerializer(serializers.Serializer):
+    created_at = serializers.DateTimeField(read_only=True)
     total_news = serializers.IntegerField()
     total_news_views = serializers.IntegerField()
     total_documents = serializers.IntegerField()
@@ -55,7 +56,7 @@ class NewsDetailModelSerializer(serializers.ModelSerializer):
     views = serializers.SerializerMethodField()
 
     def get_views(self, obj):
-        return 1
+        return getattr(obj, "views_count", 0)
 
     class Meta:
         model = NewsModel
@@ -67,7 +68,7 @@ class NewsListModelSerializer(serializers.ModelSerializer):
     views = serializers.SerializerMethodField()
 
     def get_views(self, obj):
-        return 1
+        return getattr(obj, "views_count", 0)
 
     class Meta:
         model = NewsModel
@@ -0,0 +1,71 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.tracking.signals import hits_flushed
+
+from .conditional import bump_version
+from .home import BUNDLE_VERSION_KEY
+from .models import Category, DocumentsModel, NewsModel
+from .search import update_document_vectors, update_news_vectors
+from .thumbnails import discard_variants
+from .trending import add_hits
+
+
+@receiver(post_save, sender=NewsModel)
+def update_news_search_vector(sender, instance, **kwargs):
+    update_news_vectors(NewsModel.admin_objects.filter(pk=instance.pk), instance.category.title)
+
+
+@receiver(pre_save, sender=NewsModel)
+def drop_replaced_thumbnail_variants(sender, instance, **kwargs):
+    if instance._state.adding:
+        return
+    stored = NewsModel.admin_objects.filter(pk=instance.pk).values("thumbnail", "thumbnail_variants").first()
+    if stored is None:
+        return
+    if instance.thumbnail._committed and instance.thumbnail.name == stored["thumbnail"]:
+        # Keep variants the builder stored after this instance was loaded.
+        instance.thumbnail_variants = stored["thumbnail_variants"]
+    else:
+        # build_thumbnails renders the new upload; the old variants would only leak.
+        discard_variants(instance.thumbnail.storage, stored["thumbnail_variants"])
+        instance.thumbnail_variants = {}
+
+
+@receiver(post_delete, sender=NewsModel)
+def delete_news_thumbnail_variants(sender, instance, **kwargs):
+    discard_variants(instance.thumbnail.storage, instance.thumbnail_variants)
+
+
+@receiver(pre_save, sender=Category)
+def remember_category_title(sender, instance, **kwargs):
+    instance._previous_title = Category.admin_objects.filter(pk=instance.pk).values_list("title", flat=True).first()
+
+
+@receiver(post_save, sender=Category)
+def update_category_news_search_vectors(sender, instance, created, **kwargs):
+    # The title is the only category field in the news vector.
+    if not created and instance.title != getattr(instance, "_previous_title", None):
+        update_news_vectors(NewsModel.admin_objects.filter(category=instance), instance.title)
+
+
+@receiver(post_save, sender=DocumentsModel)
+def update_document_search_vector(sender, instance, **kwargs):
+    update_document_vectors(DocumentsModel.admin_objects.filter(pk=instance.pk))
+
+
+@receiver(hits_flushed)
+def queue_trending_hits(sender, hits, **kwargs):
+    news_type = ContentType.objects.get_for_model(NewsModel)
+    add_hits({pk: count for (content_type_id, pk), count in hits.items() if content_type_id == news_type.pk})
+
+
+@receiver(post_save, sender=NewsModel)
+@receiver(post_delete, sender=NewsModel)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=DocumentsModel)
+@receiver(post_delete, sender=DocumentsModel)
+def invalidate_home_bundle(sender, **kwargs):
+    bump_version(BUNDLE_VERSION_KEY)
@@ -1,3 +1,154 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django_redis import get_redis_connection
+from PIL import Image
+
+from apps.tracking.counter import pending_hits
+from apps.users.models import UserModel
+
+from .models import Category, NewsModel
+
+
+class NewsTestCase(TestCase):
+    def setUp(self):
+        get_redis_connection("default").flushdb()
+        cache.clear()
+        user = UserModel.objects.create(username="author", first_name="A", last_name="B")
+        self.category = Category.objects.create(title="Sport", meta="sport", state="approved")
+        self.news = NewsModel.objects.create(
+            category=self.category,
+            user=user,
+            title="Futbol",
+            meta="futbol",
+            short_description="s",
+            description="d",
+            state="approved",
+        )
+
+
+class NewsDetailHitsTests(NewsTestCase):
+    def test_detail_records_one_hit_per_ip(self):
+        self.client.get("/api/news/futbol/", REMOTE_ADDR="10.0.0.1")
+        self.client.get("/api/news/futbol/", REMOTE_ADDR="10.0.0.1")
+        self.client.get("/api/news/futbol/", REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(pending_hits(self.news), 2)
+
+    def test_not_modified_still_counts(self):
+        etag = self.client.get("/api/news/futbol/", REMOTE_ADDR="10.0.0.1").headers["ETag"]
+        response = self.client.get("/api/news/futbol/", REMOTE_ADDR="10.0.0.2", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(pending_hits(self.news), 2)
+
+    def test_unknown_news_is_404(self):
+        self.assertEqual(self.client.get("/api/news/missing/").status_code, 404)
+
+
+class CategoryFeedTests(NewsTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(5):
+            NewsModel.objects.create(
+                category=self.category,
+                user=self.news.user,
+                title=f"News {i}",
+                short_description="s",
+                description="d",
+                state="approved",
+            )
+
+    def test_views_are_annotated_in_constant_queries(self):
+        ContentType.objects.clear_cache()
+        # Two validator aggregates, the category, its content type and one news query.
+        with self.assertNumQueries(5):
+            response = self.client.get("/api/categories/sport/news/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 6)
+        self.assertTrue(all("views" in news for news in response.json()))
+
+    def test_cursor_mode_pages_without_count(self):
+        response = self.client.get("/api/categories/sport/news/", {"mode": "cursor", "page_size": 4})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertNotIn("count", body)
+        self.assertEqual(len(body["results"]), 4)
+
+        response = self.client.get(body["next"])
+        self.assertEqual(len(response.json()["results"]), 2)
+        self.assertIsNone(response.json()["next"])
+
+    def test_query_params_get_their_own_etag(self):
+        first = self.client.get("/api/categories/sport/news/").headers["ETag"]
+        cursor = self.client.get("/api/categories/sport/news/", {"mode": "cursor"}).headers["ETag"]
+        self.assertNotEqual(first, cursor)
+
+        response = self.client.get("/api/categories/sport/news/", {"mode": "cursor"}, HTTP_IF_NONE_MATCH=first)
+        self.assertEqual(response.status_code, 200)
+
+
+def image_upload(name):
+    buffer = io.BytesIO()
+    Image.new("RGB", (1000, 500), "red").save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class ThumbnailVariantTests(NewsTestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        super().setUp()
+        self.news.thumbnail = image_upload("first.png")
+        self.news.save()
+
+    def build(self):
+        call_command("build_thumbnails", stdout=mock.MagicMock())
+        self.news.refresh_from_db()
+        return list(self.news.thumbnail_variants["widths"].values())
+
+    def test_command_builds_only_stale_variants(self):
+        variants = self.build()
+        self.assertEqual(len(variants), 3)
+        self.assertTrue(all(default_storage.exists(name) for name in variants))
+
+        with mock.patch("apps.news_main.thumbnails.build_thumbnail_variants") as build:
+            call_command("build_thumbnails", stdout=mock.MagicMock())
+        build.assert_not_called()
+
+    def test_replaced_thumbnail_drops_old_variants(self):
+        old = self.build()
+
+        self.news.thumbnail = image_upload("second.png")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.save()
+
+        self.assertFalse(any(default_storage.exists(name) for name in old))
+        self.assertEqual(self.news.thumbnail_variants, {})
+        self.assertEqual(len(self.build()), 3)
+
+    def test_stale_instance_keeps_stored_variants(self):
+        stale = NewsModel.admin_objects.get(pk=self.news.pk)
+        variants = self.build()
+
+        stale.title = "Renamed"
+        stale.save()
+        stale.refresh_from_db()
+        self.assertEqual(list(stale.thumbnail_variants["widths"].values()), variants)
+
+    def test_delete_removes_variants(self):
+        variants = self.build()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.delete()
+
+        self.assertFalse(any(default_storage.exists(name) for name in variants))
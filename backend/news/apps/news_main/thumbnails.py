@@ -0,0 +1,110 @@
+import io
+import logging
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.fields.json import KT
+from django.dispatch import Signal
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .models import NewsModel
+from .utils import get_variant_filename
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_WIDTHS = (320, 640, 960)
+VARIANT_FORMAT = "WEBP"
+VARIANT_EXTENSION = "webp"
+VARIANT_QUALITY = 80
+
+# Sent with ``pk`` after new variants were stored. The row is written with
+# update(), so the NewsModel post_save receivers do not run again.
+variants_built = Signal()
+
+
+def variants_are_current(news):
+    return news.thumbnail_variants.get("source") == news.thumbnail.name
+
+
+def render_variants(news):
+    """Write a WebP copy of the thumbnail for every width smaller than the original."""
+    storage = news.thumbnail.storage
+    with news.thumbnail.open("rb") as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.load()
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    widths = {}
+    for width in THUMBNAIL_WIDTHS:
+        if width >= image.width:
+            break
+        resized = image.copy()
+        resized.thumbnail((width, image.height), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        resized.save(buffer, VARIANT_FORMAT, quality=VARIANT_QUALITY, method=4)
+        name = get_variant_filename(news.thumbnail.name, width, VARIANT_EXTENSION)
+        if storage.exists(name):
+            storage.delete(name)
+        widths[str(width)] = storage.save(name, ContentFile(buffer.getvalue()))
+    return {"source": news.thumbnail.name, "widths": widths}
+
+
+def delete_variants(storage, names):
+    for name in names:
+        try:
+            storage.delete(name)
+        except Exception:
+            logger.warning("Could not delete thumbnail variant %s", name, exc_info=True)
+
+
+def build_thumbnail_variants(pk):
+    news = NewsModel.admin_objects.filter(pk=pk).first()
+    if news is None or not news.thumbnail or variants_are_current(news):
+        return
+
+    stale = set(news.thumbnail_variants.get("widths", {}).values())
+    variants = render_variants(news)
+    NewsModel.admin_objects.filter(pk=pk).update(thumbnail_variants=variants, updated_at=timezone.now())
+    variants_built.send(sender=NewsModel, pk=pk)
+    delete_variants(news.thumbnail.storage, stale - set(variants["widths"].values()))
+
+
+def stale_news():
+    """News whose stored variants were not rendered from the current thumbnail."""
+    return (
+        NewsModel.admin_objects.exclude(thumbnail="")
+        .alias(variants_source=KT("thumbnail_variants__source"))
+        .filter(Q(variants_source__isnull=True) | ~Q(variants_source=F("thumbnail")))
+    )
+
+
+def build_stale_variants():
+    built = 0
+    for pk in stale_news().values_list("pk", flat=True).iterator():
+        try:
+            build_thumbnail_variants(pk)
+        except Exception:
+            logger.exception("Thumbnail variants failed for news %s", pk)
+            continue
+        built += 1
+    return built
+
+
+def discard_variants(storage, variants):
+    """Delete ``variants`` from storage once the current transaction commits."""
+    names = list(variants.get("widths", {}).values())
+    if names:
+        transaction.on_commit(lambda: delete_variants(storage, names))
+
+
+def srcset(news):
+    if not variants_are_current(news):
+        return ""
+    storage = news.thumbnail.storage
+    widths = news.thumbnail_variants["widths"]
+    return ", ".join(f"{storage.url(widths[width])} {width}w" for width in sorted(widths, key=int))
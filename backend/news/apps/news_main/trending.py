@@ -0,0 +1,93 @@
+import time
+
+from django.db import models
+from django.db.models import Case, When
+from django.dispatch import Signal
+
+from django_redis import get_redis_connection
+
+from .conditional import bump_version
+
+TRENDING_KEY = "news:trending"
+PENDING_KEY = "news:trending:pending"
+RANKING_KEY = "news:trending:ranking"
+RANKED_AT_KEY = "news:trending:ranked_at"
+TRENDING_VERSION_KEY = "news:trending:version"
+
+# A hit counts half as much after this many seconds.
+HALF_LIFE = 60 * 60 * 24
+# Scores that decayed below this are dropped from the sorted set.
+MIN_SCORE = 0.01
+TRENDING_SIZE = 50
+
+# Sent by rank_trending after the ranking was rewritten.
+trending_ranked = Signal()
+
+
+def add_hits(hits):
+    """Queue fresh hit counts (``{guid: n}``) for the next ranking run."""
+    if not hits:
+        return
+    redis = get_redis_connection("default")
+    pipe = redis.pipeline()
+    for guid, count in hits.items():
+        pipe.zincrby(PENDING_KEY, count, str(guid))
+    pipe.execute()
+
+
+def rank_trending():
+    """
+    Decay every stored score by the time since the previous run and add the queued hits.
+
+    ZUNIONSTORE applies the decay as a weight, so the whole ranking is rewritten
+    inside Redis without reading scores back.
+    """
+    redis = get_redis_connection("default")
+    now = time.time()
+    ranked_at = float(redis.get(RANKED_AT_KEY) or now)
+    decay = 0.5 ** ((now - ranked_at) / HALF_LIFE)
+
+    # Hits queued while this run is in progress land in a fresh pending set.
+    if redis.exists(RANKING_KEY):
+        # An earlier run died after claiming its hits: rank them together with the new ones.
+        pipe = redis.pipeline()
+        pipe.zunionstore(RANKING_KEY, [RANKING_KEY, PENDING_KEY])
+        pipe.delete(PENDING_KEY)
+        pipe.execute()
+    elif redis.exists(PENDING_KEY):
+        redis.rename(PENDING_KEY, RANKING_KEY)
+
+    pipe = redis.pipeline()
+    pipe.zunionstore(TRENDING_KEY, {TRENDING_KEY: decay, RANKING_KEY: 1})
+    pipe.delete(RANKING_KEY)
+    pipe.zremrangebyscore(TRENDING_KEY, "-inf", MIN_SCORE)
+    pipe.set(RANKED_AT_KEY, now)
+    pipe.zcard(TRENDING_KEY)
+    size = pipe.execute()[-1]
+
+    bump_version(TRENDING_VERSION_KEY)
+    trending_ranked.send(sender=rank_trending)
+    return size
+
+
+def trending_ids(limit=TRENDING_SIZE):
+    return [guid.decode() for guid in get_redis_connection("default").zrevrange(TRENDING_KEY, 0, limit - 1)]
+
+
+def order_by_trending(queryset, limit=TRENDING_SIZE):
+    """
+    The ``limit`` top trending news of ``queryset``, in score order.
+
+    Only the ranked rows are sorted, never the whole table. Until the first
+    ranking run the newest ``limit`` news stand in.
+    """
+    ids = trending_ids(limit)
+    if not ids:
+        newest = list(queryset.order_by("-created_at").values_list("pk", flat=True)[:limit])
+        return queryset.filter(pk__in=newest).order_by("-created_at")
+
+    rank = Case(
+        *[When(pk=guid, then=position) for position, guid in enumerate(ids)],
+        output_field=models.IntegerField(),
+    )
+    return queryset.filter(pk__in=ids).annotate(trending_rank=rank).order_by("trending_rank")
@@ -1,7 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views import KasanaUzHomePageDataApiView, NewsHomeViewSet, NewsWeeklyViewSet, DocumentsHomeAPIView, NewsDetailsAPIView, CategoriesAPIView
+from .views import HomeBundleAPIView, KasanaUzHomePageDataApiView, NewsHomeViewSet, NewsWeeklyViewSet, DocumentsHomeAPIView, NewsDetailsAPIView, CategoriesAPIView
 
 app_name = "news_main"
 
@@ -11,6 +11,7 @@ router.register(r"weekly", NewsWeeklyViewSet, basename="weekly")
 router.register(r"categories", CategoriesAPIView, basename="categories")
 
 urlpatterns = [
+    path("home-bundle/", HomeBundleAPIView.as_view(), name="home-bundle"),
     path("main-home/", KasanaUzHomePageDataApiView.as_view(), name="main-home"),
     path("documents/", DocumentsHomeAPIView.as_view()),
     path("news/<str:meta>/", NewsDetailsAPIView.as_view()),
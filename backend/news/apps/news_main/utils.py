@@ -4,3 +4,9 @@ import os
 def get_filename(instance, filename):
     ext = filename.split(".")[-1]
     return f"uploads/{os.urandom(16).hex()}.{ext}"
+
+
+def get_variant_filename(name, width, ext):
+    """Name a resized copy of ``name`` so it sits next to the original upload."""
+    stem, _ = os.path.splitext(name)
+    return f"{stem}_w{width}.{ext}"
@@ -5,14 +5,24 @@ from rest_framework.views import APIView
 from rest_framework import viewsets
 from rest_framework.response import Response
 
+from apps.tracking.counter import record_hit
+from apps.tracking.utils import client_ip, with_views
+
+from .conditional import HITS_VERSION_KEY, ConditionalGetMixin
 from .models import DocumentsModel, NewsModel, Category
+from .home import BUNDLE_VERSION_KEY, get_home_bundle
+from .pagination import NewsCursorPagination
+from .trending import TRENDING_VERSION_KEY, order_by_trending
 from .serializers import DocumentsReadOnlySerializer, NewsHomeSerializer, NewsDetailModelSerializer, CategorySerializer, NewsListModelSerializer
 
 
-class KasanaUzHomePageDataApiView(APIView):
+class KasanaUzHomePageDataApiView(ConditionalGetMixin, APIView):
     authentication_classes = []
     permission_classes = [AllowAny]
 
+    def get_validators(self, request, *args, **kwargs):
+        return [DocumentsModel.objects.all()]
+
     def get(self, request, *args, **kwargs):
         legacy_qs = DocumentsModel.objects.filter(doc_type="legacy_documents").order_by("-created_at")[:4]
 
@@ -29,29 +39,52 @@ class KasanaUzHomePageDataApiView(APIView):
         )
 
 
-class NewsHomeViewSet(viewsets.ViewSet):
+class HomeBundleAPIView(ConditionalGetMixin, APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get_validators(self, request, *args, **kwargs):
+        return [BUNDLE_VERSION_KEY]
+
+    def get(self, request):
+        return Response(get_home_bundle())
+
+
+class NewsHomeViewSet(ConditionalGetMixin, viewsets.ViewSet):
     authentication_classes = []
     permission_classes = [AllowAny]
 
+    def get_validators(self, request, *args, **kwargs):
+        return [NewsModel.objects.all(), Category.objects.all()]
+
     def list(self, request):
-        queryset = NewsModel.objects.all().order_by("-created_at")[:5]
+        queryset = NewsModel.objects.select_related("category").order_by("-created_at")[:5]
         serializer = NewsHomeSerializer(queryset, many=True, context={"request": request})
         return Response(serializer.data)
 
 
-class NewsWeeklyViewSet(viewsets.ReadOnlyModelViewSet):
+class NewsWeeklyViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     authentication_classes = []
     permission_classes = [AllowAny]
     serializer_class = NewsHomeSerializer
 
+    def get_validators(self, request, *args, **kwargs):
+        return [NewsModel.objects.all(), Category.objects.all(), TRENDING_VERSION_KEY]
+
     def get_queryset(self):
-        return NewsModel.objects.all().order_by("-created_at")
+        queryset = NewsModel.objects.select_related("category")
+        if self.action == "list":
+            return order_by_trending(queryset)
+        return queryset
 
 
-class DocumentsHomeAPIView(APIView):
+class DocumentsHomeAPIView(ConditionalGetMixin, APIView):
     authentication_classes = []
     permission_classes = [AllowAny]
 
+    def get_validators(self, request, *args, **kwargs):
+        return [DocumentsModel.objects.all()]
+
     def get(self, request):
         legacy = DocumentsModel.objects.filter(doc_type="legacy_documents").order_by("-created_at")[:5]
         business = DocumentsModel.objects.filter(doc_type="business_documents").order_by("-created_at")[:5]
@@ -62,28 +95,50 @@ class DocumentsHomeAPIView(APIView):
         })
 
 
-class NewsDetailsAPIView(APIView):
+class NewsDetailsAPIView(ConditionalGetMixin, APIView):
     authentication_classes = []
     permission_classes = [AllowAny]
-    
+
+    def get_validators(self, request, meta):
+        return [NewsModel.objects.filter(meta=meta), Category.objects.filter(category_news__meta=meta), HITS_VERSION_KEY]
+
+    def initial(self, request, *args, **kwargs):
+        # Counted before the conditional check, so a 304 is still a view.
+        news = NewsModel.objects.filter(meta=kwargs["meta"]).only("pk").first()
+        if news is not None:
+            record_hit(news, client_ip(request))
+        super().initial(request, *args, **kwargs)
+
     def get(self, request, meta: str):
-        news = NewsModel.objects.get(meta=meta)
+        try:
+            news = with_views(NewsModel.objects.select_related("category")).get(meta=meta)
+        except NewsModel.DoesNotExist:
+            return Response({"message": "News not found"}, status=404)
         serializer = NewsDetailModelSerializer(news)
 
         return Response(serializer.data)
 
 
-class CategoriesAPIView(viewsets.ReadOnlyModelViewSet):
+class CategoriesAPIView(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     pagination_class = None
     permission_classes = [AllowAny]
     lookup_field = "meta"
 
+    def get_validators(self, request, *args, **kwargs):
+        return [Category.objects.all(), NewsModel.objects.all(), HITS_VERSION_KEY]
+
     @action(detail=True, methods=["get"], url_path="news")
     def news(self, request, meta=None):
         category = self.get_object()
-        news = NewsModel.objects.filter(category=category).order_by("-created_at")
+        news = with_views(NewsModel.objects.filter(category=category).select_related("category")).order_by("-created_at")
+
+        if NewsCursorPagination.is_requested(request):
+            paginator = NewsCursorPagination()
+            page = paginator.paginate_queryset(news, request, view=self)
+            serializer = NewsListModelSerializer(page, many=True, context={"request": request})
+            return paginator.get_paginated_response(serializer.data)
 
         page = self.paginate_queryset(news)
         if page is not None:
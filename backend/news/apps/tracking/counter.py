@@ -0,0 +1,118 @@
+import uuid
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Case, F, When
+from django.utils import timezone
+
+from django_redis import get_redis_connection
+
+from .signals import hits_flushed
+from .tracking_model import CustomHitCount, HitFlushBatch
+
+PENDING_KEY = "hits:pending"
+FLUSHING_KEY = "hits:flushing"
+FLUSHING_BATCH_KEY = "hits:flushing:batch"
+# Applied-batch markers only need to outlive a crashed flush being retried.
+BATCH_MARKER_TTL = timedelta(days=7)
+SEEN_KEY = "hits:seen:{content_type}:{object_pk}:{day}"
+SEEN_TTL = 60 * 60 * 48
+FLUSH_BATCH_SIZE = 500
+
+
+def _member(content_type_id, object_pk):
+    return f"{content_type_id}:{object_pk}"
+
+
+def record_hit(obj, ip):
+    """Count one view per IP per day in Redis; the database is only touched by flush_hits."""
+    content_type = ContentType.objects.get_for_model(obj.__class__)
+    seen_key = SEEN_KEY.format(
+        content_type=content_type.pk, object_pk=obj.pk, day=timezone.localdate().strftime("%Y%m%d")
+    )
+
+    redis = get_redis_connection("default")
+    pipe = redis.pipeline()
+    pipe.sadd(seen_key, ip or "unknown")
+    pipe.expire(seen_key, SEEN_TTL)
+    added, _ = pipe.execute()
+
+    if added:
+        redis.hincrby(PENDING_KEY, _member(content_type.pk, obj.pk), 1)
+    return bool(added)
+
+
+def pending_hits(obj):
+    """Hits recorded for ``obj`` that have not been flushed to the database yet."""
+    content_type = ContentType.objects.get_for_model(obj.__class__)
+    member = _member(content_type.pk, obj.pk)
+    pipe = get_redis_connection("default").pipeline()
+    pipe.hget(PENDING_KEY, member)
+    # Counts being flushed right now are still pending until the flush commits.
+    pipe.hget(FLUSHING_KEY, member)
+    return sum(int(value or 0) for value in pipe.execute())
+
+
+def _start_batch(redis):
+    """Move pending hits to the flushing hash under a fresh batch id, atomically."""
+    pipe = redis.pipeline(transaction=True)
+    pipe.rename(PENDING_KEY, FLUSHING_KEY)
+    pipe.set(FLUSHING_BATCH_KEY, uuid.uuid4().hex)
+    pipe.execute()
+
+
+def _finish_batch(redis):
+    pipe = redis.pipeline(transaction=True)
+    pipe.delete(FLUSHING_KEY, FLUSHING_BATCH_KEY)
+    pipe.execute()
+
+
+def flush_hits():
+    """Fold pending Redis hits into hitcount_custom_hit_count with bulk statements."""
+    redis = get_redis_connection("default")
+
+    # A previous flush may have died after the rename; finish its batch first.
+    if not redis.exists(FLUSHING_KEY):
+        if not redis.exists(PENDING_KEY):
+            return {}
+        _start_batch(redis)
+
+    batch_id = redis.get(FLUSHING_BATCH_KEY)
+    if batch_id is None:
+        batch_id = uuid.uuid4().hex
+        redis.set(FLUSHING_BATCH_KEY, batch_id)
+    batch_id = batch_id.decode() if isinstance(batch_id, bytes) else batch_id
+
+    pending = {}
+    for member, value in redis.hgetall(FLUSHING_KEY).items():
+        content_type_id, object_pk = member.decode().split(":", 1)
+        pending[(int(content_type_id), object_pk)] = int(value)
+
+    items = list(pending.items())
+    with transaction.atomic():
+        # The marker commits with the counts, so a batch that was applied before a crash is not applied twice.
+        _, created = HitFlushBatch.objects.get_or_create(batch_id=batch_id)
+        if not created:
+            pending = {}
+            items = []
+        CustomHitCount.objects.bulk_create(
+            [CustomHitCount(content_type_id=ct, object_pk=pk, hits=0) for ct, pk in pending],
+            ignore_conflicts=True,
+        )
+        for start in range(0, len(items), FLUSH_BATCH_SIZE):
+            batch = items[start : start + FLUSH_BATCH_SIZE]
+            CustomHitCount.objects.filter(object_pk__in=[pk for (_, pk), _ in batch]).update(
+                hits=Case(
+                    *[When(content_type_id=ct, object_pk=pk, then=F("hits") + n) for (ct, pk), n in batch],
+                    default=F("hits"),
+                    output_field=models.BigIntegerField(),
+                ),
+                modified=timezone.now(),
+            )
+        HitFlushBatch.objects.filter(applied_at__lt=timezone.now() - BATCH_MARKER_TTL).delete()
+
+    _finish_batch(redis)
+    if pending:
+        hits_flushed.send(sender=CustomHitCount, hits=pending)
+    return pending
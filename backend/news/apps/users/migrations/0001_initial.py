@@ -0,0 +1,49 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:47
+
+import django.contrib.auth.models
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserModel',
+            fields=[
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('email', models.EmailField(blank=True, max_length=254, verbose_name='email address')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('first_name', models.CharField(max_length=256)),
+                ('last_name', models.CharField(max_length=256)),
+                ('username', models.CharField(max_length=256, unique=True)),
+                ('role', models.CharField(choices=[('superadmin', 'Superadmin'), ('admin', 'Admin'), ('moderator', 'Moderator'), ('user', 'Foydalanuvchi'), ('housemaker', 'Kasanachi')], default='user', max_length=16)),
+                ('permissions', models.JSONField(default=dict)),
+            ],
+            options={
+                'verbose_name': 'Foydalanuvchi',
+                'verbose_name_plural': 'Foydalanuvchilar',
+                'ordering': ('-created_at',),
+                'managed': False,
+            },
+            managers=[
+                ('objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+    ]
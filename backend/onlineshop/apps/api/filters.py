@@ -2,6 +2,7 @@ from django.db.models import Q
 
 import django_filters
 
+from apps.onlineshop_main import search
 from apps.onlineshop_main.models import Category, Product
 
 
@@ -22,6 +23,8 @@ class ProductFilter(django_filters.FilterSet):
     q = django_filters.CharFilter(method="search")
 
     def search(self, queryset, name, value):
+        if search.is_supported():
+            return search.search_products(queryset, value)
         return queryset.filter(
             Q(title__icontains=value) | Q(short_description__icontains=value) | Q(description__icontains=value)
         )
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.onlineshop_main.conditional import bump_version
+from apps.onlineshop_main.models import Category, Product, ProductLike, ProductSellDocument
+
+from .serializers import FullLoadContentSerializer
+
+HOME_CACHE_KEY = "onlineshop:home:{scope}"
+HOME_VERSION_KEY = "onlineshop:home:version"
+# Snapshot keys written by the last full rebuild, so the next one can drop removed categories.
+HOME_KEYS_KEY = "onlineshop:home:keys"
+STORE_FRONT = "all"
+
+RAIL_SIZE = 8
+# Sales and likes older than this no longer lift a product into a rail.
+RAIL_WINDOW = timedelta(days=30)
+
+
+def _top_products(rows, limit):
+    return list(rows.values_list("product", flat=True).annotate(total=Count("pk")).order_by("-total")[:limit])
+
+
+def _rail_ids(products):
+    """Product guids for the three rails, topped up with the newest products when activity is thin."""
+    since = timezone.now() - RAIL_WINDOW
+    scoped = products.values("pk")
+
+    new = list(products.order_by("-created_at", "-guid").values_list("guid", flat=True)[:RAIL_SIZE])
+    fast_selling = _top_products(ProductSellDocument.objects.filter(product__in=scoped, created_at__gte=since), RAIL_SIZE)
+    recommended = _top_products(ProductLike.objects.filter(product__in=scoped, created_at__gte=since), RAIL_SIZE)
+
+    for rail in (fast_selling, recommended):
+        rail += [guid for guid in new if guid not in rail][: RAIL_SIZE - len(rail)]
+    return {"fast_selling_products": fast_selling, "new_products": new, "recommended_products": recommended}
+
+
+def build_home_payload(categories, category=None):
+    products = Product.objects.all()
+    if category is not None:
+        products = products.filter(category=category)
+
+    rails = _rail_ids(products)
+    found = Product.objects.select_related("user", "category", "primary_image").in_bulk(
+        {guid for rail in rails.values() for guid in rail}
+    )
+    serializer = FullLoadContentSerializer(
+        {
+            "categories": categories,
+            **{name: [found[guid] for guid in rail if guid in found] for name, rail in rails.items()},
+        }
+    )
+    return serializer.data
+
+
+def _render(categories, category=None):
+    return JSONRenderer().render(build_home_payload(categories, category))
+
+
+def rebuild_home_rails():
+    """Render the store front and every category page once and store them as ready-to-send JSON."""
+    categories = list(Category.objects.all())
+    snapshots = {HOME_CACHE_KEY.format(scope=STORE_FRONT): _render(categories)}
+    for category in categories:
+        snapshots[HOME_CACHE_KEY.format(scope=category.pk)] = _render(categories, category)
+
+    cache.set_many(snapshots, timeout=None)
+    removed = set(cache.get(HOME_KEYS_KEY, ())) - set(snapshots)
+    if removed:
+        cache.delete_many(list(removed))
+    cache.set(HOME_KEYS_KEY, list(snapshots), timeout=None)
+    bump_version(HOME_VERSION_KEY)
+    return len(snapshots)
+
+
+def get_home_rails(category=None):
+    key = HOME_CACHE_KEY.format(scope=category.pk if category else STORE_FRONT)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        # Only until the next scheduled rebuild: fill in the one page that was asked for.
+        snapshot = _render(list(Category.objects.all()), category)
+        cache.set(key, snapshot, timeout=None)
+        # The ETag is shared by every page, so copies validated before this build must go stale.
+        bump_version(HOME_VERSION_KEY)
+    return snapshot
@@ -1,5 +1,7 @@
+from django.db import models
 from rest_framework import serializers
 
+from apps.onlineshop_main.likes import attach_like_counts, attach_liked
 from apps.onlineshop_main.models import Category, Product, ProductComment, ProductImage
 from apps.users.user_model import UserModel
 
@@ -22,56 +24,138 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ["guid", "title", "meta"]
 
 
+def _request_user(context):
+    request = context.get("request")
+    return getattr(request, "user", None)
+
+
+class LikeCountListSerializer(serializers.ListSerializer):
+    """Load ``likes_count`` and ``is_liked`` for the whole list with one Redis round trip each."""
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        attach_like_counts(items)
+        if "is_liked" in self.child.fields:
+            attach_liked(_request_user(self.context), items)
+        return super().to_representation(items)
+
+
+class LikesCountMixin(serializers.Serializer):
+    likes_count = serializers.SerializerMethodField()
+    # False unless the serializer context carries an authenticated request. Anonymous
+    # endpoints leave it out of Meta.fields; clients ask profile/liked-state/ instead.
+    is_liked = serializers.SerializerMethodField()
+
+    def get_likes_count(self, obj):
+        if not hasattr(obj, "likes_count"):
+            attach_like_counts([obj])
+        return obj.likes_count
+
+    def get_is_liked(self, obj):
+        if not hasattr(obj, "is_liked"):
+            attach_liked(_request_user(self.context), [obj])
+        return obj.is_liked
+
+
 class ProductImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProductImage
         fields = ["guid", "image"]
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(LikesCountMixin, serializers.ModelSerializer):
     category = CategorySerializer()
     image = serializers.SerializerMethodField()
     user = ProductUserSerializer()
 
     def get_image(self, obj):
         try:
-            return obj.onlineshop_app_product_images.first().image.url
+            return obj.primary_image.image.url
         except Exception as err:
             return f"Error: {err}"
 
     class Meta:
         model = Product
-        fields = ["guid", "user", "category", "title", "meta", "short_description", "price", "price_discount", "image"]
+        fields = [
+            "guid",
+            "user",
+            "category",
+            "title",
+            "meta",
+            "short_description",
+            "price",
+            "price_discount",
+            "image",
+            "likes_count",
+            "is_liked",
+            "rating_avg",
+            "rating_count",
+        ]
+        list_serializer_class = LikeCountListSerializer
+
+
+class PublicProductSerializer(ProductSerializer):
+    """``ProductSerializer`` for anonymous endpoints and shared snapshots, without ``is_liked``."""
+
+    class Meta(ProductSerializer.Meta):
+        fields = [field for field in ProductSerializer.Meta.fields if field != "is_liked"]
 
 
-class CategoryListProductSerializer(serializers.ModelSerializer):
+class CategoryListProductSerializer(LikesCountMixin, serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
     user = ProductUserSerializer()
 
     def get_image(self, obj):
         try:
-            return obj.onlineshop_app_product_images.first().image.url
+            return obj.primary_image.image.url
         except:
             return ""
 
     class Meta:
         model = Product
-        fields = ["guid", "user", "title", "meta", "short_description", "price", "price_discount", "image"]
+        fields = [
+            "guid",
+            "user",
+            "title",
+            "meta",
+            "short_description",
+            "price",
+            "price_discount",
+            "image",
+            "likes_count",
+            "rating_avg",
+            "rating_count",
+        ]
+        list_serializer_class = LikeCountListSerializer
 
 
-class UserProductSerializer(serializers.ModelSerializer):
+class UserProductSerializer(LikesCountMixin, serializers.ModelSerializer):
     category = CategorySerializer()
     image = serializers.SerializerMethodField()
 
     def get_image(self, obj):
         try:
-            return obj.onlineshop_app_product_images.first().image.url
+            return obj.primary_image.image.url
         except:
             return "/assets/images/404.png"
 
     class Meta:
         model = Product
-        fields = ["guid", "category", "title", "meta", "short_description", "price", "price_discount", "image"]
+        fields = [
+            "guid",
+            "category",
+            "title",
+            "meta",
+            "short_description",
+            "price",
+            "price_discount",
+            "image",
+            "likes_count",
+            "is_liked",
+            "rating_avg",
+            "rating_count",
+        ]
+        list_serializer_class = LikeCountListSerializer
 
 
 class CreateProductSerializer(serializers.ModelSerializer):
@@ -82,9 +166,9 @@ class CreateProductSerializer(serializers.ModelSerializer):
 
 class FullLoadContentSerializer(serializers.Serializer):
     categories = CategorySerializer(many=True)
-    fast_selling_products = ProductSerializer(many=True)
-    new_products = ProductSerializer(many=True)
-    recommended_products = ProductSerializer(many=True)
+    fast_selling_products = PublicProductSerializer(many=True)
+    new_products = PublicProductSerializer(many=True)
+    recommended_products = PublicProductSerializer(many=True)
 
 
 class CategoryProductSerializer(serializers.ModelSerializer):
@@ -92,14 +176,14 @@ class CategoryProductSerializer(serializers.ModelSerializer):
     user = ProductUserSerializer()
 
     def get_image(self, obj):
-        return obj.onlineshop_app_product_images.first().image.url
+        return obj.primary_image.image.url
 
     class Meta:
         model = Product
         fields = ["guid", "user", "title", "meta", "short_description", "price", "price_discount", "image"]
 
 
-class ProductFullSerializer(serializers.ModelSerializer):
+class ProductFullSerializer(LikesCountMixin, serializers.ModelSerializer):
     category = CategorySerializer()
     user = ProductUserPurposesSerializer()
     onlineshop_app_product_images = ProductImageSerializer(many=True)
@@ -117,6 +201,10 @@ class ProductFullSerializer(serializers.ModelSerializer):
             "price",
             "price_discount",
             "is_verified",
+            "likes_count",
+            "is_liked",
+            "rating_avg",
+            "rating_count",
             "onlineshop_app_product_images",
         ]
 
@@ -130,7 +218,7 @@ class LeastProductSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
 
     def get_image(self, obj):
-        return obj.onlineshop_app_product_images.first().image.url
+        return obj.primary_image.image.url
 
     class Meta:
         model = Product
@@ -147,30 +235,39 @@ class ReplyCommentSerializer(serializers.ModelSerializer):
 
 class FlatReplySerializer(serializers.ModelSerializer):
     user = ProductUserSerializer()
+    reply = serializers.UUIDField(source="reply_id", read_only=True)
 
     class Meta:
         model = ProductComment
-        fields = ["guid", "user", "comment", "created_at"]
+        fields = ["guid", "user", "comment", "reply", "depth", "created_at"]
 
 
 class RootCommentSerializer(serializers.ModelSerializer):
     user = ProductUserSerializer()
     replies = serializers.SerializerMethodField()
+    reply_count = serializers.SerializerMethodField()
 
     class Meta:
         model = ProductComment
-        fields = ["guid", "user", "comment", "created_at", "replies"]
+        fields = ["guid", "user", "comment", "created_at", "reply_count", "replies"]
+
+    def _replies(self, obj):
+        # Threads loaded by apps.onlineshop_main.comments.load_threads carry their replies already.
+        if not hasattr(obj, "thread_replies"):
+            obj.thread_replies = list(
+                ProductComment.objects.filter(root_id=obj.root_id, path__startswith=f"{obj.path}/")
+                .select_related("user")
+                .order_by("path")
+            )
+            obj.reply_count = len(obj.thread_replies)
+        return obj.thread_replies
 
     def get_replies(self, obj):
-        def collect_all_replies(comment):
-            all_replies = []
-            for reply in comment.onlineshop_app_comment_replies.all():
-                all_replies.append(reply)
-                all_replies += collect_all_replies(reply)
-            return all_replies
-
-        all_flat_replies = collect_all_replies(obj)
-        return FlatReplySerializer(all_flat_replies, many=True, context=self.context).data
+        return FlatReplySerializer(self._replies(obj), many=True, context=self.context).data
+
+    def get_reply_count(self, obj):
+        self._replies(obj)
+        return obj.reply_count
 
 
 class SearchResultSerializer(serializers.Serializer):
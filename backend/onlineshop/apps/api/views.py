@@ -1,30 +1,43 @@
 import uuid
 import random
+from decimal import Decimal, InvalidOperation
 
-from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from django.utils.decorators import method_decorator
 from django.utils.text import slugify
-from django.views.decorators.cache import cache_page
 
 from rest_framework import generics, pagination, response, views, status
+from rest_framework.exceptions import NotFound
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 
+from apps.onlineshop_main.comments import load_threads
+from apps.onlineshop_main.conditional import ConditionalGetMixin
+from apps.onlineshop_main.featured import pool_slice
+from apps.onlineshop_main.likes import LIKES_VERSION_KEY, is_liked, liked_product_ids, liked_subset, toggle_like
+from apps.onlineshop_main.pagination import DEFAULT_SORT, ProductKeysetPagination, sort_products
+from apps.onlineshop_main.product_cache import cached_product_payload, cached_product_payloads
+from apps.onlineshop_main.related import related_ids
+from apps.onlineshop_main.search import HISTOGRAM_BUCKETS, category_facets, price_histogram, with_effective_price
+from apps.onlineshop_main.uploads import UploadError, finalize_uploads, issue_upload_urls
 from apps.onlineshop_main.models import (
     Category,
     Product,
     ProductImage,
-    ProductLike,
     ProductComment,
 )
 
 from .filters import CategoryFilter, ProductFilter
+from .home import HOME_VERSION_KEY, get_home_rails
 from .serializers import (
     CategorySerializer,
     CategoryListProductSerializer,
     ProductSerializer,
+    PublicProductSerializer,
     FullProductSerializer,
     LeastProductSerializer,
     UserProductSerializer,
@@ -74,40 +87,118 @@ class ProductsPageNumberPagination(pagination.PageNumberPagination):
         )
 
 
+def parse_guid_list(raw, limit):
+    """Normalize ``a,b`` or ``["a", "b"]`` into guid strings; raises ValueError on bad input."""
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    if not isinstance(raw, list):
+        raise ValueError("guids must be a list")
+    if len(raw) > limit:
+        raise ValueError(f"at most {limit} guids per request")
+    return [str(uuid.UUID(str(guid).strip())) for guid in raw if str(guid).strip()]
+
+
 # ----------------- Categories -----------------
 
-class CategoriesApiView(ListAPIView):
+class CategoriesApiView(ConditionalGetMixin, ListAPIView):
     permission_classes = [AllowAny]
     authentication_classes = []
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     pagination_class = None
 
+    def get_validators(self, request):
+        return [Category.objects.all()]
+
 
-class CategoryContentApiView(ListAPIView):
+class CategoryContentApiView(ConditionalGetMixin, ListAPIView):
     permission_classes = [AllowAny]
     authentication_classes = []
     serializer_class = CategoryListProductSerializer
 
+    def get_validators(self, request, category):
+        return [
+            Product.objects.filter(category__meta=category),
+            ProductImage.objects.filter(product__category__meta=category),
+            LIKES_VERSION_KEY,
+        ]
+
     def get_queryset(self):
         category_meta = self.kwargs.get("category")
         category = get_object_or_404(Category, meta=category_meta)
-        return category.onlineshop_app_category_products.all()
+        return category.onlineshop_app_category_products.select_related("user", "primary_image")
 
 
 # ----------------- Products -----------------
 
+class HomeRailsApiView(ConditionalGetMixin, views.APIView):
+    """The store front rails, or one category's with ``?category=<meta>``, served from snapshots."""
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get_validators(self, request):
+        return [HOME_VERSION_KEY]
+
+    def get(self, request):
+        category = None
+        category_meta = request.query_params.get("category")
+        if category_meta:
+            category = get_object_or_404(Category, meta=category_meta)
+        return HttpResponse(get_home_rails(category), content_type="application/json")
+
+
 class TopProductsApiView(ListAPIView):
     permission_classes = [AllowAny]
     authentication_classes = []
-    serializer_class = ProductSerializer
-    queryset = Product.objects.order_by("?")
+    serializer_class = PublicProductSerializer
     pagination_class = ProductsPageNumberPagination
+    # Served only until reshuffle_top_products has filled the pool.
+    queryset = Product.objects.select_related("user", "category", "primary_image").order_by(
+        "-rating_avg", "-rating_count", "-guid"
+    )
+
+    def list(self, request, *args, **kwargs):
+        try:
+            page = int(request.query_params.get(self.paginator.page_query_param, 1))
+        except ValueError:
+            page = 0
+        if page < 1:
+            raise NotFound("Invalid page.")
+
+        limit = self.paginator.get_page_size(request)
+        pool = pool_slice((page - 1) * limit, page * limit)
+        if pool is None:
+            return super().list(request, *args, **kwargs)
+        ids, total = pool
+
+        products = {
+            str(product.guid): product
+            for product in Product.objects.select_related("user", "category", "primary_image").filter(guid__in=ids)
+        }
+        # Products withdrawn since the last reshuffle are simply skipped.
+        page_products = [products[guid] for guid in ids if guid in products]
+
+        serializer = self.get_serializer(page_products, many=True)
+        return response.Response({"results": serializer.data, "page": page, "limit": limit, "total": total})
 
 
 class ProductContentApiView(views.APIView):
     permission_classes = []
 
+    def get_related(self, product, limit):
+        products = Product.objects.select_related("user", "category", "primary_image")
+        ids = related_ids(product, limit)
+        found = {str(related.guid): related for related in products.filter(guid__in=ids)}
+        related = [found[guid] for guid in ids if guid in found]
+
+        # Products added since the last index build have no neighbours yet.
+        if len(related) < limit:
+            related += products.filter(category=product.category_id).exclude(
+                guid__in=[product.pk, *found]
+            )[: limit - len(related)]
+        return related
+
     def get(self, request, meta):
         try:
             product = (
@@ -118,34 +209,33 @@ class ProductContentApiView(views.APIView):
         except Product.DoesNotExist:
             return response.Response({"message": "Product not found"}, status=404)
 
-        related_products = product.category.onlineshop_app_category_products.all()[:4]
-        serializer = FullProductSerializer({"product": product, "related": related_products})
+        related_products = self.get_related(product, 4)
+        serializer = FullProductSerializer(
+            {"product": product, "related": related_products}, context={"request": request}
+        )
         return response.Response(serializer.data)
 
 
 class MessageProductContentApiView(views.APIView):
     permission_classes = []
 
-    @method_decorator(cache_page(60 * 60 * 24 * 30))
-    def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
-
     def get(self, request, guid):
-        product = Product.objects.filter(guid=guid).first()
-        if not product:
+        def build():
+            product = Product.objects.select_related("primary_image").filter(guid=guid).first()
+            return LeastProductSerializer(product).data if product else None
+
+        data = cached_product_payload(guid, "message", build)
+        if data is None:
             return response.Response({"message": "Product not found"}, status=404)
-        serializer = LeastProductSerializer(product)
-        return response.Response(serializer.data)
+        return response.Response(data)
 
 
 class UserProductsApiView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        products = Product.admin_objects.filter(user=request.user).prefetch_related(
-            "onlineshop_app_product_images", "category"
-        )
-        serializer = UserProductSerializer(products, many=True)
+        products = Product.admin_objects.filter(user=request.user).select_related("category", "primary_image")
+        serializer = UserProductSerializer(products, many=True, context={"request": request})
         return response.Response(serializer.data)
 
 
@@ -153,11 +243,11 @@ class UserLikedProductsApiView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        liked_products = Product.objects.filter(
-            onlineshop_app_product_likes__user=request.user
-        ).prefetch_related("onlineshop_app_product_images", "category")
+        liked_products = Product.objects.filter(guid__in=liked_product_ids(request.user)).select_related(
+            "user", "category", "primary_image"
+        )
 
-        serializer = ProductSerializer(liked_products, many=True)
+        serializer = ProductSerializer(liked_products, many=True, context={"request": request})
         return response.Response(serializer.data)
 
 
@@ -172,7 +262,13 @@ class UserUploadProductApiView(views.APIView):
         return slug
 
     def post(self, request: Request):
-        data = request.data.dict()
+        if hasattr(request.data, "getlist"):
+            data = request.data.dict()
+            staged_keys = request.data.getlist("images")
+        else:
+            data = dict(request.data)
+            staged_keys = data.get("images") or []
+        data.pop("images", None)
         data["user"] = request.user.guid
 
         title = data.get("title")
@@ -193,30 +289,58 @@ class UserUploadProductApiView(views.APIView):
                     request.user.is_kasanachi = True
                     request.user.save()
 
-                    return response.Response(
-                        {"message": "Product created successfully", "product_meta": product.meta, "images": len(images)},
-                        status=201,
-                    )
-            except Exception as e:
+                    attached = finalize_uploads(request.user, product, staged_keys) if staged_keys else []
+            except (IntegrityError, ValidationError) as e:
                 return response.Response({"error": str(e)}, status=400)
+            return response.Response(
+                {
+                    "message": "Product created successfully",
+                    "product_meta": product.meta,
+                    "images": len(images) + len(attached),
+                },
+                status=201,
+            )
         return response.Response(serializer.errors, status=400)
 
 
+class UserProductImageUploadUrlsApiView(views.APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        try:
+            uploads = issue_upload_urls(request.user, request.data.get("files") or [])
+        except UploadError as e:
+            return response.Response({"error": str(e)}, status=400)
+        return response.Response({"uploads": uploads}, status=201)
+
+
+class UserProductImagesFinalizeApiView(views.APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, meta):
+        product = Product.admin_objects.filter(meta=meta, user=request.user).first()
+        if not product:
+            return response.Response({"message": "Product not found"}, status=404)
+
+        keys = request.data.get("keys")
+        if not isinstance(keys, list) or not keys:
+            return response.Response({"error": "keys must be a non-empty list"}, status=400)
+
+        attached = finalize_uploads(request.user, product, keys)
+        return response.Response({"images": attached}, status=201)
+
+
 class UserLikeProductApiView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
         if "guid" not in request.data.keys():
-            return {"details": "guid is missing"}
+            return response.Response({"details": "guid is missing"}, status=400)
         product = Product.objects.filter(guid=request.data.get("guid")).first()
         if not product:
             return response.Response({"message": "Product not found"}, status=404)
 
-        like, created = ProductLike.objects.get_or_create(user=request.user, product=product)
-        if created:
-            return response.Response({"liked": True})
-        like.delete()
-        return response.Response({"liked": False})
+        return response.Response({"liked": toggle_like(request.user, product)})
 
 
 class UserIsProductLikedApiView(views.APIView):
@@ -225,27 +349,53 @@ class UserIsProductLikedApiView(views.APIView):
     def post(self, request):
         if "guid" not in request.data.keys():
             return response.Response({"details": "guid is missing"})
-        return response.Response({
-            "isProductLiked": ProductLike.objects.filter(
-                user=request.user,
-                product__guid=request.data.get("guid")
-            ).exists()
-        })
+        return response.Response({"isProductLiked": is_liked(request.user, request.data.get("guid"))})
+
+
+class UserLikedStateApiView(views.APIView):
+    """Which of up to ``max_guids`` products the user likes, e.g. for a whole product grid."""
+
+    permission_classes = [IsAuthenticated]
+    max_guids = 200
+
+    def post(self, request):
+        try:
+            guids = parse_guid_list(request.data.get("guids", []), self.max_guids)
+        except (TypeError, ValueError) as err:
+            return response.Response({"detail": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+
+        liked = liked_subset(request.user, guids)
+        return response.Response({"liked": [guid for guid in guids if guid in liked]})
 
 
 # ----------------- Comments -----------------
 
-class ProductCommentListAPIView(generics.ListAPIView):
+class ProductCommentListAPIView(ConditionalGetMixin, generics.ListAPIView):
     serializer_class = RootCommentSerializer
     permission_classes = [AllowAny]
 
+    def get_validators(self, request, guid):
+        return [ProductComment.objects.filter(product__guid=guid)]
+
     def get_queryset(self):
-        return (
-            ProductComment.objects.filter(product__guid=self.kwargs["guid"], reply__isnull=True)
-            .select_related("user")
-            .prefetch_related("onlineshop_app_comment_replies")
+        return ProductComment.objects.filter(product__guid=self.kwargs["guid"], reply__isnull=True).select_related(
+            "user"
         )
 
+    def list(self, request, *args, **kwargs):
+        try:
+            replies_limit = int(request.query_params["replies"])
+        except (KeyError, ValueError):
+            replies_limit = None
+
+        page = self.paginate_queryset(self.get_queryset())
+        if page is not None:
+            serializer = self.get_serializer(load_threads(page, replies_limit), many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(load_threads(self.get_queryset(), replies_limit), many=True)
+        return response.Response(serializer.data)
+
 
 class ProductCommentCreateAPIView(generics.CreateAPIView):
     serializer_class = RootCommentSerializer
@@ -287,9 +437,12 @@ class WebsearchApiView(views.APIView):
     permission_classes = []
 
     def get(self, request):
+        if request.GET.get("mode") == "facets":
+            return self.faceted(request)
+
         category_qs = CategoryFilter(request.GET, queryset=Category.objects.all()).qs
         product_qs = ProductFilter(
-            request.GET, queryset=Product.objects.select_related("category").prefetch_related("onlineshop_app_product_images")
+            request.GET, queryset=Product.objects.select_related("category")
         ).qs
 
         cat_pag = CategoryLimitOffsetPagination()
@@ -316,29 +469,110 @@ class WebsearchApiView(views.APIView):
         )
 
 
+    def faceted(self, request):
+        """Ranked products with per-category counts and a price histogram for the same query."""
+        q = request.GET.get("q", "").strip()
+        matched = ProductFilter({"q": q}, queryset=Product.objects.all()).qs if q else Product.objects.all()
+        matched = with_effective_price(matched)
+
+        by_category = Q()
+        category_metas = [meta.strip() for meta in request.GET.get("categories", "").split(",") if meta.strip()]
+        if category_metas:
+            by_category = Q(category__meta__in=category_metas)
+
+        by_price = Q()
+        try:
+            if request.GET.get("price_min"):
+                by_price &= Q(effective_price__gte=Decimal(request.GET["price_min"]))
+            if request.GET.get("price_max"):
+                by_price &= Q(effective_price__lte=Decimal(request.GET["price_max"]))
+            buckets = min(max(int(request.GET.get("buckets", HISTOGRAM_BUCKETS)), 1), 50)
+        except (InvalidOperation, ValueError):
+            return response.Response({"error": "Invalid price or buckets"}, status=400)
+
+        # Each facet ignores its own filter so the UI can offer the alternatives.
+        products = matched.filter(by_category, by_price).select_related("user", "category", "primary_image")
+        if not q:
+            products = products.order_by("-created_at")
+
+        prod_pag = ProductLimitOffsetPagination()
+        page = prod_pag.paginate_queryset(products, request, view=self)
+
+        return response.Response(
+            {
+                "products": {
+                    "count": prod_pag.count,
+                    "next": prod_pag.get_next_link(),
+                    "previous": prod_pag.get_previous_link(),
+                    "results": ProductSerializer(page, many=True, context={"request": request}).data,
+                },
+                "categories": category_facets(matched.filter(by_price)),
+                "price_histogram": price_histogram(matched.filter(by_category), buckets),
+            }
+        )
+
+
 # ----------------- Microservice Endpoint -----------------
 
+def product_data_queryset():
+    return Product.objects.select_related("user", "category").only(
+        "guid", "title", "user__guid", "category__guid",
+        "short_description", "price", "price_discount"
+    )
+
+
 class ProductDataView(views.APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, guid, *args, **kwargs):
-        product = get_object_or_404(
-            Product.objects.select_related("user", "category").only(
-                "guid", "title", "user__guid", "category__guid",
-                "short_description", "price", "price_discount"
-            ),
-            guid=guid
-        )
-        serializer = ProductDataSerializer(product)
-        return response.Response(serializer.data, status=status.HTTP_200_OK)
+        def build():
+            product = get_object_or_404(product_data_queryset(), guid=guid)
+            return ProductDataSerializer(product).data
+
+        return response.Response(cached_product_payload(guid, "data", build), status=status.HTTP_200_OK)
+
+
+class ProductDataBatchView(views.APIView):
+    """
+    ``ProductDataView`` for many products at once: ``?guids=a,b`` or a JSON body ``{"guids": [...]}``.
+
+    Only found products are returned, in request order; each one is cached on its own.
+    """
+
+    permission_classes = [AllowAny]
+    max_guids = 200
+
+    def _respond(self, raw):
+        try:
+            guids = parse_guid_list(raw, self.max_guids)
+        except (TypeError, ValueError) as err:
+            return response.Response({"detail": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+
+        def build_many(missing):
+            products = product_data_queryset().filter(guid__in=missing)
+            return {product.guid: ProductDataSerializer(product).data for product in products}
+
+        payloads = cached_product_payloads(guids, "data", build_many)
+        return response.Response([payloads[guid] for guid in guids if guid in payloads], status=status.HTTP_200_OK)
+
+    def get(self, request, *args, **kwargs):
+        return self._respond(request.query_params.get("guids", ""))
+
+    def post(self, request, *args, **kwargs):
+        return self._respond(request.data.get("guids", []))
 
 
 class FilterApiView(ListAPIView):
+    """
+    Browse products: ``?categories=a,b``, ``?sort=`` one of ``SORT_MODES`` and ``?mode=cursor``
+    for keyset pagination; without it the page-number response is unchanged.
+    """
+
     permission_classes = []
     serializer_class = ProductSerializer
 
     def get_queryset(self):
-        queryset = Product.objects.select_related("category")
+        queryset = Product.objects.select_related("user", "category", "primary_image")
 
         categories_param = self.request.GET.get("categories")
 
@@ -348,6 +582,17 @@ class FilterApiView(ListAPIView):
                 for meta in categories_param.split(",")
                 if meta.strip()
             ]
-            queryset = queryset.filter(category__meta__in=category_metas)
+            # Resolving the guids first lets the category-leading sort indexes be used.
+            category_ids = list(Category.objects.filter(meta__in=category_metas).values_list("guid", flat=True))
+            queryset = queryset.filter(category__in=category_ids)
+
+        return sort_products(queryset, self.request.GET.get("sort", DEFAULT_SORT))
+
+    def list(self, request, *args, **kwargs):
+        if not ProductKeysetPagination.is_requested(request):
+            return super().list(request, *args, **kwargs)
 
-        return queryset
+        paginator = ProductKeysetPagination()
+        page = paginator.paginate_queryset(self.get_queryset(), request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
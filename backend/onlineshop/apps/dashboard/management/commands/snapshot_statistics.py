@@ -0,0 +1,9 @@
+from apps.dashboard.statistics import take_snapshot
+from apps.onlineshop_main.management.base import IntervalCommand
+
+
+class Command(IntervalCommand):
+    help = "Store a time-stamped snapshot of the online shop dashboard statistics"
+
+    def run_once(self):
+        return f"Stored {take_snapshot()}"
@@ -1,3 +1,21 @@
 from django.db import models
 
-# Create your models here.
+
+class OnlineShopStatisticsSnapshot(models.Model):
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    total_products = models.PositiveIntegerField(default=0)
+    total_sold = models.PositiveIntegerField(default=0)
+    unverified_count = models.PositiveIntegerField(default=0)
+    visible_products = models.PositiveIntegerField(default=0)
+    invisible_products = models.PositiveIntegerField(default=0)
+    banned_products = models.PositiveIntegerField(default=0)
+    category_stats = models.JSONField(default=dict)
+
+    def __str__(self):
+        return f"Statistics at {self.created_at:%Y-%m-%d %H:%M}"
+
+    class Meta:
+        verbose_name = "Online Shop Statistics Snapshot"
+        verbose_name_plural = "Online Shop Statistics Snapshots"
+        db_table = "onlineshop_app__statistics_snapshots"
+        ordering = ("-created_at",)
@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.onlineshop_main.base_model import ModelStateChoices
+from apps.onlineshop_main.models import Product, ProductSellDocument
+
+from .models import OnlineShopStatisticsSnapshot
+
+# The per-category product aggregate is the expensive part, and moderators
+# reload the dashboard far more often than the catalog changes.
+SNAPSHOT_MAX_AGE = timedelta(minutes=5)
+
+APPROVED = Q(state=ModelStateChoices.APPROVED)
+
+
+def collect_onlineshop_statistics():
+    """Dashboard totals from one conditional aggregate over products grouped by category."""
+    rows = (
+        Product.admin_objects.values("category__title")
+        .annotate(
+            approved=Count("pk", filter=APPROVED),
+            visible=Count("pk", filter=APPROVED & Q(is_active=True)),
+            unverified=Count("pk", filter=Q(state=ModelStateChoices.ON_MODERATION)),
+            banned=Count("pk", filter=Q(state=ModelStateChoices.BANNED)),
+        )
+        .order_by()
+    )
+
+    totals = {"total_products": 0, "visible_products": 0, "unverified_count": 0, "banned_products": 0}
+    category_stats = {}
+    for row in rows:
+        if row["approved"]:
+            category_stats[row["category__title"]] = row["approved"]
+        totals["total_products"] += row["approved"]
+        totals["visible_products"] += row["visible"]
+        totals["unverified_count"] += row["unverified"]
+        totals["banned_products"] += row["banned"]
+
+    return {
+        **totals,
+        "invisible_products": totals["total_products"] - totals["visible_products"],
+        "total_sold": ProductSellDocument.objects.count(),
+        "category_stats": category_stats,
+    }
+
+
+def take_snapshot():
+    return OnlineShopStatisticsSnapshot.objects.create(**collect_onlineshop_statistics())
+
+
+def get_snapshot(max_age=SNAPSHOT_MAX_AGE):
+    """The latest snapshot, taking a new one when none is fresher than ``max_age``."""
+    snapshot = OnlineShopStatisticsSnapshot.objects.first()
+    if snapshot is None or snapshot.created_at < timezone.now() - max_age:
+        snapshot = take_snapshot()
+    return snapshot
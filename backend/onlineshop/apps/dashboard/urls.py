@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import AdminCategoriesViewSet, AdminProductsViewSet, OnlineShopStatisticsView
+from .views import AdminCategoriesViewSet, AdminProductsViewSet, OnlineShopStatisticsHistoryView, OnlineShopStatisticsView
 
 app_name = "dashboard"
 
@@ -12,5 +12,6 @@ router.register(r"products", AdminProductsViewSet, basename="admin-products")
 
 urlpatterns = [
     path("", include(router.urls), name="uAdmin123"),
-    path("statistics", OnlineShopStatisticsView.as_view(), name="statistics")
+    path("statistics", OnlineShopStatisticsView.as_view(), name="statistics"),
+    path("statistics/history", OnlineShopStatisticsHistoryView.as_view(), name="statistics-history"),
 ]
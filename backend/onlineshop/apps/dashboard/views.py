@@ -1,15 +1,19 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
-from django.db.models import Count
+from django.utils import timezone
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status, views
 
-from apps.onlineshop_main.models import Category, Product, ProductSellDocument
+from apps.onlineshop_main.models import Category, Product
 from apps.onlineshop_main.serializers import OnlineShopStatisticsSerializer
 
+from .models import OnlineShopStatisticsSnapshot
 from .serializers import AdminManageCategoriesModelSerializer, AdminManageProductsModelSerializer
 from .viewset import BaseAdminViewSet
 from .permissions import HasPermission
+from .statistics import get_snapshot
 
 
 class AdminCategoriesViewSet(BaseAdminViewSet):
@@ -93,30 +97,21 @@ class OnlineShopStatisticsView(views.APIView):
     permission_classes = [HasPermission]
 
     def post(self, request, *args, **kwargs):
-        total_products = Product.objects.count()
-        total_sold = ProductSellDocument.objects.count()
-
-        category_qs = (
-            Product.objects.values("category__title")
-            .annotate(count=Count("guid"))
-            .order_by()
-        )
-        category_stats = {row["category__title"]: row["count"] for row in category_qs}
-
-        visible_products = Product.objects.filter(is_active=True).count()
-        invisible_products = Product.objects.filter(is_active=False).count()
-
-        unverified_count = Product.objects.filter(meta="unverified").count() if hasattr(Product, "meta") else 0
-        banned_products = Product.objects.filter(meta="banned").count() if hasattr(Product, "meta") else 0
-
-        data = {
-            "total_products": total_products,
-            "total_sold": total_sold,
-            "category_stats": category_stats,
-            "unverified_count": unverified_count,
-            "visible_products": visible_products,
-            "invisible_products": invisible_products,
-            "banned_products": banned_products,
-        }
-        serializer = OnlineShopStatisticsSerializer(data)
+        serializer = OnlineShopStatisticsSerializer(get_snapshot())
+        return Response(serializer.data)
+
+
+class OnlineShopStatisticsHistoryView(views.APIView):
+    permission_classes = [HasPermission]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            days = min(max(int(request.query_params.get("days", 30)), 1), 365)
+        except ValueError:
+            return Response({"detail": "days must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        snapshots = OnlineShopStatisticsSnapshot.objects.filter(
+            created_at__gte=timezone.now() - timedelta(days=days)
+        ).order_by("created_at")
+        serializer = OnlineShopStatisticsSerializer(snapshots, many=True)
         return Response(serializer.data)
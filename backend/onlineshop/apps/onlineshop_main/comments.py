@@ -0,0 +1,57 @@
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+from .models import ProductComment
+
+
+def load_threads(roots, replies_limit=None):
+    """
+    Attach ``thread_replies`` (depth-first, flattened) and ``reply_count`` to every root comment.
+
+    All replies of all given threads come back in one query; ``replies_limit``
+    keeps only the first N replies of each thread (negative values count as 0).
+    ``reply_count`` comes from a separate grouped count and always reports the
+    full size, so collapsed threads can show "N more".
+    """
+    roots = list(roots)
+    threads = {root.pk: root for root in roots}
+    for root in roots:
+        root.thread_replies = []
+        root.reply_count = 0
+
+    thread_replies = ProductComment.objects.filter(root__in=list(threads), depth__gt=0)
+    for row in thread_replies.order_by().values("root").annotate(count=Count("pk")):
+        threads[row["root"]].reply_count = row["count"]
+
+    if replies_limit is not None:
+        replies_limit = max(replies_limit, 0)
+        if replies_limit == 0:
+            return roots
+
+    replies = (
+        thread_replies.select_related("user")
+        .annotate(position=Window(RowNumber(), partition_by=[F("root")], order_by=F("path").asc()))
+        .order_by("root", "path")
+    )
+    if replies_limit is not None:
+        replies = replies.filter(position__lte=replies_limit)
+
+    for reply in replies:
+        threads[reply.root_id].thread_replies.append(reply)
+    return roots
+
+
+def rebuild_comment_paths():
+    """Recompute root, depth and path for every comment, parents before children."""
+    updated = 0
+    level = list(ProductComment.objects.filter(reply__isnull=True).order_by("created_at"))
+    while level:
+        for comment in level:
+            comment.path = ""
+            comment.save(update_fields=["root", "depth", "path"])
+        updated += len(level)
+        parents = {comment.pk: comment for comment in level}
+        level = list(ProductComment.objects.filter(reply__in=list(parents)).order_by("created_at"))
+        for comment in level:
+            comment.reply = parents[comment.reply_id]
+    return updated
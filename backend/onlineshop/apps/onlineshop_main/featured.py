@@ -0,0 +1,86 @@
+import math
+import random
+
+from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from django_redis import get_redis_connection
+
+from .models import Product, ProductLike
+
+POOL_KEY = "onlineshop:top:pool"
+POOL_SIZE = 200
+
+LIKES_WEIGHT = 1.0
+RATING_WEIGHT = 0.5
+RECENCY_WEIGHT = 2.0
+# Recency adds half as much for a product this many days older.
+RECENCY_HALF_LIFE_DAYS = 14
+
+
+def _score(row, now):
+    age_days = (now - row["created_at"]).total_seconds() / 86400
+    return (
+        LIKES_WEIGHT * math.log1p(row["likes"])
+        + RATING_WEIGHT * row["rating"]
+        + RECENCY_WEIGHT * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+    )
+
+
+def candidate_scores():
+    likes = (
+        ProductLike.objects.filter(product=OuterRef("pk"))
+        .order_by()
+        .values("product")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    rows = Product.objects.order_by().values("guid", "created_at").annotate(
+        likes=Coalesce(Subquery(likes), 0, output_field=models.IntegerField()),
+        rating=F("rating_avg"),
+    )
+
+    now = timezone.now()
+    return {str(row["guid"]): _score(row, now) for row in rows.iterator()}
+
+
+def reshuffle_pool(size=POOL_SIZE):
+    """
+    Keep the best ``size`` products and store them in a weighted random order.
+
+    Each candidate is keyed by ``random() ** (1 / score)``, so higher scores
+    tend to come first while every run still yields a different order.
+    """
+    scores = candidate_scores()
+    best = sorted(scores, key=scores.get, reverse=True)[:size]
+    pool = sorted(best, key=lambda guid: random.random() ** (1 / max(scores[guid], 1e-6)), reverse=True)
+
+    redis = get_redis_connection("default")
+    pipe = redis.pipeline()
+    staging = f"{POOL_KEY}:staging"
+    pipe.delete(staging)
+    if pool:
+        pipe.rpush(staging, *pool)
+        pipe.rename(staging, POOL_KEY)
+    else:
+        pipe.delete(POOL_KEY)
+    pipe.execute()
+    return len(pool)
+
+
+def pool_slice(start, stop):
+    """
+    Product ids at positions ``start``..``stop - 1`` and the pool size, in one round trip.
+
+    Returns ``None`` while the pool is cold; reshuffle_top_products builds it
+    on startup and keeps it warm, requests never rescore the catalog.
+    """
+    pipe = get_redis_connection("default").pipeline()
+    pipe.lrange(POOL_KEY, start, stop - 1)
+    pipe.llen(POOL_KEY)
+    ids, total = pipe.execute()
+    if not total:
+        return None
+    return [guid.decode() for guid in ids], total
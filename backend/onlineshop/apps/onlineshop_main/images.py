@@ -0,0 +1,9 @@
+from django.db.models import OuterRef, Subquery
+
+from .models import ProductImage
+
+
+def refresh_primary_images(products):
+    """Point ``primary_image`` of every product in ``products`` at its newest image in one UPDATE."""
+    newest = ProductImage.objects.filter(product=OuterRef("pk")).order_by("-created_at").values("pk")[:1]
+    return products.update(primary_image=Subquery(newest))
@@ -0,0 +1,175 @@
+import logging
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from django_redis import get_redis_connection
+
+from apps.users.models import UserModel
+
+from .conditional import bump_version
+from .models import Product, ProductLike
+
+logger = logging.getLogger(__name__)
+
+COUNTS_KEY = "likes:counts"
+USER_KEY = "likes:user:{user}"
+USER_LOADED_KEY = "likes:user:{user}:loaded"
+USER_TTL = 60 * 60 * 24 * 7
+PENDING_KEY = "likes:pending"
+FLUSHING_KEY = "likes:flushing"
+FLUSH_BATCH_SIZE = 500
+# Bumped on every like change, since likes_count never touches updated_at.
+LIKES_VERSION_KEY = "onlineshop:likes:version"
+
+
+def _member(user_id, product_id):
+    return f"{user_id}:{product_id}"
+
+
+def _load_user_likes(redis, user):
+    """Seed the user's Redis like set from the table the first time it is needed."""
+    key = USER_KEY.format(user=user.pk)
+    loaded = USER_LOADED_KEY.format(user=user.pk)
+    if not redis.exists(loaded):
+        liked = [str(pk) for pk in ProductLike.objects.filter(user=user).values_list("product_id", flat=True)]
+        pipe = redis.pipeline()
+        if liked:
+            pipe.sadd(key, *liked)
+        pipe.set(loaded, 1)
+        pipe.execute()
+    pipe = redis.pipeline()
+    pipe.expire(key, USER_TTL)
+    pipe.expire(loaded, USER_TTL)
+    pipe.execute()
+    return key
+
+
+def _load_counts(redis, product_ids):
+    """Counts for ``product_ids``, filling gaps in the Redis hash with one grouped query."""
+    product_ids = [str(pk) for pk in product_ids]
+    if not product_ids:
+        return {}
+    counts = dict(zip(product_ids, redis.hmget(COUNTS_KEY, product_ids)))
+
+    missing = [pk for pk, count in counts.items() if count is None]
+    if missing:
+        stored = {
+            str(row["product"]): row["count"]
+            for row in ProductLike.objects.filter(product__in=missing)
+            .order_by()
+            .values("product")
+            .annotate(count=Count("pk"))
+        }
+        pipe = redis.pipeline()
+        for pk in missing:
+            pipe.hsetnx(COUNTS_KEY, pk, stored.get(pk, 0))
+        pipe.execute()
+        counts.update(zip(missing, redis.hmget(COUNTS_KEY, missing)))
+    return {pk: int(count) for pk, count in counts.items()}
+
+
+def toggle_like(user, product):
+    """Like or unlike ``product`` for ``user`` in Redis; the table is updated by flush_likes."""
+    redis = get_redis_connection("default")
+    key = _load_user_likes(redis, user)
+    _load_counts(redis, [product.pk])
+
+    liked = bool(redis.sadd(key, str(product.pk)))
+    if not liked:
+        redis.srem(key, str(product.pk))
+
+    pipe = redis.pipeline()
+    pipe.hincrby(COUNTS_KEY, str(product.pk), 1 if liked else -1)
+    pipe.hset(PENDING_KEY, _member(user.pk, product.pk), int(liked))
+    pipe.execute()
+    bump_version(LIKES_VERSION_KEY)
+    return liked
+
+
+def liked_product_ids(user):
+    redis = get_redis_connection("default")
+    return [pk.decode() for pk in redis.smembers(_load_user_likes(redis, user))]
+
+
+def is_liked(user, product_id):
+    redis = get_redis_connection("default")
+    return bool(redis.sismember(_load_user_likes(redis, user), str(product_id)))
+
+
+def liked_subset(user, product_ids):
+    """The members of ``product_ids`` that ``user`` likes, checked in one pipelined round trip."""
+    product_ids = [str(pk) for pk in product_ids]
+    if not product_ids:
+        return set()
+    redis = get_redis_connection("default")
+    key = _load_user_likes(redis, user)
+    pipe = redis.pipeline()
+    for pk in product_ids:
+        pipe.sismember(key, pk)
+    return {pk for pk, liked in zip(product_ids, pipe.execute()) if liked}
+
+
+def attach_liked(user, products):
+    """Set ``is_liked`` on every product; anonymous users never reach Redis."""
+    liked = liked_subset(user, [product.pk for product in products]) if user and user.is_authenticated else set()
+    for product in products:
+        product.is_liked = str(product.pk) in liked
+    return products
+
+
+def attach_like_counts(products):
+    """Set ``likes_count`` on every product with one HMGET."""
+    counts = _load_counts(get_redis_connection("default"), [product.pk for product in products])
+    for product in products:
+        product.likes_count = counts.get(str(product.pk), 0)
+    return products
+
+
+def _existing(likes):
+    """Drop likes whose product or user was deleted after the like was buffered."""
+    products = {
+        str(pk) for pk in Product.admin_objects.filter(pk__in={pk for _, pk in likes}).values_list("pk", flat=True)
+    }
+    users = {str(pk) for pk in UserModel.objects.filter(pk__in={pk for pk, _ in likes}).values_list("pk", flat=True)}
+    return [(user_id, product_id) for user_id, product_id in likes if user_id in users and product_id in products]
+
+
+def flush_likes():
+    """Write pending likes and unlikes to onlineshop_app__product_likes in bulk."""
+    redis = get_redis_connection("default")
+
+    # A previous flush may have died after the rename; finish its batch first.
+    if not redis.exists(FLUSHING_KEY):
+        if not redis.exists(PENDING_KEY):
+            return 0
+        redis.rename(PENDING_KEY, FLUSHING_KEY)
+
+    likes, unlikes = [], []
+    for member, value in redis.hgetall(FLUSHING_KEY).items():
+        user_id, product_id = member.decode().split(":", 1)
+        (likes if value == b"1" else unlikes).append((user_id, product_id))
+
+    try:
+        with transaction.atomic():
+            ProductLike.objects.bulk_create(
+                [ProductLike(user_id=user_id, product_id=product_id) for user_id, product_id in _existing(likes)],
+                batch_size=FLUSH_BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            for start in range(0, len(unlikes), FLUSH_BATCH_SIZE):
+                batch = unlikes[start : start + FLUSH_BATCH_SIZE]
+                ProductLike.objects.filter(
+                    reduce(or_, [Q(user_id=user_id, product_id=product_id) for user_id, product_id in batch])
+                ).delete()
+    except Exception:
+        # The batch stays in FLUSHING_KEY and is retried first on the next flush;
+        # new toggles keep collecting in PENDING_KEY meanwhile.
+        logger.exception("Like flush failed, %d changes kept for the next flush", len(likes) + len(unlikes))
+        return 0
+
+    redis.delete(FLUSHING_KEY)
+    bump_version(LIKES_VERSION_KEY)
+    return len(likes) + len(unlikes)
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class IntervalCommand(BaseCommand):
+    """
+    Run ``run_once`` a single time, or every ``--interval`` seconds for the stack services.
+
+    Subclasses implement ``run_once`` and return the line to report for that run.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep running and repeat every N seconds (0 runs once and exits)",
+        )
+
+    def run_once(self):
+        raise NotImplementedError
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+        while True:
+            self.stdout.write(self.run_once())
+            if not interval:
+                break
+            time.sleep(interval)
@@ -0,0 +1,9 @@
+from apps.api.home import rebuild_home_rails
+from apps.onlineshop_main.management.base import IntervalCommand
+
+
+class Command(IntervalCommand):
+    help = "Recompute the store front and per-category homepage rails and store them as snapshots"
+
+    def run_once(self):
+        return f"Stored {rebuild_home_rails()} homepage snapshots"
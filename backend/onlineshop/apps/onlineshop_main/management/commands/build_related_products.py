@@ -0,0 +1,9 @@
+from apps.onlineshop_main.management.base import IntervalCommand
+from apps.onlineshop_main.related import build_related_index
+
+
+class Command(IntervalCommand):
+    help = "Recompute the related products of every product and store them in Redis"
+
+    def run_once(self):
+        return f"Related products indexed for {build_related_index()} products"
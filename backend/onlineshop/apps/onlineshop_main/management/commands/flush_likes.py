@@ -0,0 +1,9 @@
+from apps.onlineshop_main.likes import flush_likes
+from apps.onlineshop_main.management.base import IntervalCommand
+
+
+class Command(IntervalCommand):
+    help = "Flush likes and unlikes buffered in Redis into onlineshop_app__product_likes"
+
+    def run_once(self):
+        return f"Flushed {flush_likes()} like changes"
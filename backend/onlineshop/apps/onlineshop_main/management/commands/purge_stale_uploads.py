@@ -0,0 +1,9 @@
+from apps.onlineshop_main.management.base import IntervalCommand
+from apps.onlineshop_main.uploads import purge_stale_uploads
+
+
+class Command(IntervalCommand):
+    help = "Delete presigned product image uploads that were never attached to a product"
+
+    def run_once(self):
+        return f"Purged {purge_stale_uploads()} stale uploads"
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.onlineshop_main.comments import rebuild_comment_paths
+
+
+class Command(BaseCommand):
+    help = "Recompute the thread root, depth and path of every product comment"
+
+    def handle(self, *args, **options):
+        updated = rebuild_comment_paths()
+        self.stdout.write(self.style.SUCCESS(f"Thread paths rebuilt for {updated} comments"))
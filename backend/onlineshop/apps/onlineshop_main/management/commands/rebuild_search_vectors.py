@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from apps.onlineshop_main.models import Category, Product
+from apps.onlineshop_main.search import is_supported, update_product_vectors
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored full-text search vectors for products"
+
+    def handle(self, *args, **options):
+        if not is_supported():
+            self.stdout.write(self.style.ERROR("Full-text search requires PostgreSQL."))
+            return
+
+        for category in Category.admin_objects.all():
+            update_product_vectors(Product.admin_objects.filter(category=category), category.title)
+
+        self.stdout.write(self.style.SUCCESS("Search vectors rebuilt"))
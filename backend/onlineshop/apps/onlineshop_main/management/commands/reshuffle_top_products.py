@@ -0,0 +1,9 @@
+from apps.onlineshop_main.featured import reshuffle_pool
+from apps.onlineshop_main.management.base import IntervalCommand
+
+
+class Command(IntervalCommand):
+    help = "Rescore products and reshuffle the top products pool kept in Redis"
+
+    def run_once(self):
+        return f"Top products pool holds {reshuffle_pool()} products"
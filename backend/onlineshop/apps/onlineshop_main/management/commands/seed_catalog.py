@@ -0,0 +1,221 @@
+import random
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image, ImageDraw
+
+from apps.onlineshop_main.base_model import ModelStateChoices
+from apps.onlineshop_main.images import refresh_primary_images
+from apps.onlineshop_main.models import Category, Product, ProductComment, ProductImage, ProductLike, ProductRating
+from apps.onlineshop_main.ratings import recompute_ratings
+from apps.onlineshop_main.search import is_supported
+from apps.users.models import UserModel
+
+ADJECTIVES = ["Qo'lda", "Milliy", "Yangi", "Klassik", "Zamonaviy", "Ekologik", "Premium", "Oddiy", "Katta", "Kichik"]
+NOUNS = ["ko'ylak", "do'ppi", "sumka", "piyola", "gilam", "choynak", "savat", "ro'mol", "kosa", "atlas", "shamdon", "taqinchoq"]
+WORDS = ADJECTIVES + NOUNS + ["sifatli", "chiroyli", "arzon", "tabiiy", "ipak", "paxta", "yog'och", "sopol", "rangli", "uy"]
+FIRST_NAMES = ["Axmad", "Nurillo", "Akbar", "Muhammadaziz", "Dilnoza", "Malika", "Jasur", "Sevara"]
+LAST_NAMES = ["Axmadov", "Nurilloyev", "Akbarov", "Karimova", "Yusupova", "Rashidov", "Tosheva"]
+
+# Most generated products are publicly visible, the rest exercise the moderation paths.
+STATE_WEIGHTS = {
+    ModelStateChoices.APPROVED: 90,
+    ModelStateChoices.ON_MODERATION: 6,
+    ModelStateChoices.HIDDEN: 2,
+    ModelStateChoices.BANNED: 2,
+}
+
+
+class Command(BaseCommand):
+    help = "Generate a large deterministic catalog offline (no network) for load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=1, help="Same seed, same catalog; reruns skip existing rows")
+        parser.add_argument("--users", type=int, default=1000, help="Maximum number of existing users to use")
+        parser.add_argument("--categories", type=int, default=40)
+        parser.add_argument("--products", type=int, default=100_000)
+        parser.add_argument("--images", type=int, default=3, help="Maximum images per product")
+        parser.add_argument("--likes", type=int, default=300_000)
+        parser.add_argument("--ratings", type=int, default=200_000)
+        parser.add_argument("--comments", type=int, default=200_000)
+        parser.add_argument("--reply-ratio", type=float, default=0.5, help="Share of comments that reply to another")
+        parser.add_argument("--placeholders", type=int, default=24, help="Distinct placeholder images to render")
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.seed = options["seed"]
+        self.batch_size = options["batch_size"]
+
+        placeholders = self.render_placeholders(options["placeholders"])
+        users = self.load_users(options["users"])
+        categories = self.create_categories(options["categories"])
+        products = self.create_products(options["products"], users, categories, placeholders, options["images"])
+        self.create_likes(options["likes"], users, products)
+        self.create_ratings(options["ratings"], users, products)
+        self.create_comments(options["comments"], options["reply_ratio"], users, products)
+        self.finish()
+
+    def guid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def sentence(self, words):
+        return " ".join(self.rng.choice(WORDS) for _ in range(words)).capitalize()
+
+    def bulk_insert(self, model, rows):
+        with transaction.atomic():
+            model.objects.bulk_create(rows, batch_size=self.batch_size, ignore_conflicts=True)
+
+    def batched(self, total, build):
+        """Yield ``total`` built rows ``batch_size`` at a time so memory stays flat."""
+        for start in range(0, total, self.batch_size):
+            yield [build(i) for i in range(start, min(start + self.batch_size, total))]
+
+    def render_placeholders(self, count):
+        """Render ``count`` flat-colour JPEGs once; every generated image row points at one of them."""
+        names = []
+        for n in range(count):
+            name = f"products/seed/placeholder-{self.seed}-{n:03d}.jpg"
+            if not default_storage.exists(name):
+                # A separate generator keeps the catalog identical whether or not the files already exist.
+                palette = random.Random(f"{self.seed}:{n}")
+                color = tuple(palette.randrange(60, 230) for _ in range(3))
+                image = Image.new("RGB", (800, 800), color)
+                draw = ImageDraw.Draw(image)
+                draw.rectangle((200, 200, 600, 600), outline=(255, 255, 255), width=12)
+                draw.text((380, 390), f"{n:03d}", fill=(255, 255, 255))
+                buffer = BytesIO()
+                image.save(buffer, "JPEG", quality=80)
+                default_storage.save(name, ContentFile(buffer.getvalue()))
+            names.append(name)
+        self.stdout.write(f"{len(names)} placeholder images ready")
+        return names
+
+    def load_users(self, count):
+        """Up to ``count`` existing user ids; the users table belongs to the users service."""
+        guids = list(UserModel.objects.order_by("guid").values_list("guid", flat=True)[:count])
+        if not guids:
+            raise CommandError("No users to attach the catalog to; register some through the users service first")
+        self.stdout.write(f"{len(guids)} users")
+        return guids
+
+    def create_categories(self, count):
+        rows = [
+            Category(
+                guid=self.guid(),
+                title=f"{self.rng.choice(ADJECTIVES)} {self.rng.choice(NOUNS)} {i}",
+                meta=f"seed{self.seed}-category-{i}",
+                state=ModelStateChoices.APPROVED,
+            )
+            for i in range(count)
+        ]
+        self.bulk_insert(Category, rows)
+        self.stdout.write(f"{len(rows)} categories")
+        return [row.guid for row in rows]
+
+    def create_products(self, count, users, categories, placeholders, max_images):
+        states, weights = list(STATE_WEIGHTS), list(STATE_WEIGHTS.values())
+
+        def build(i):
+            price = Decimal(self.rng.randrange(5_000, 5_000_000, 500))
+            discounted = self.rng.random() < 0.3
+            return Product(
+                guid=self.guid(),
+                user_id=self.rng.choice(users),
+                category_id=self.rng.choice(categories),
+                title=f"{self.rng.choice(ADJECTIVES)} {self.rng.choice(NOUNS)} {i}",
+                meta=f"seed{self.seed}-product-{i}",
+                short_description=self.sentence(8),
+                description=" ".join(self.sentence(12) + "." for _ in range(4)),
+                price=price,
+                price_discount=(price * Decimal("0.8")).quantize(Decimal("1")) if discounted else None,
+                state=self.rng.choices(states, weights)[0],
+                is_active=self.rng.random() < 0.95,
+            )
+
+        guids = []
+        for rows in self.batched(count, build):
+            self.bulk_insert(Product, rows)
+            images = [
+                ProductImage(guid=self.guid(), product_id=row.guid, image=self.rng.choice(placeholders))
+                for row in rows
+                for _ in range(self.rng.randint(1, max_images) if max_images else 0)
+            ]
+            self.bulk_insert(ProductImage, images)
+            guids += [row.guid for row in rows]
+            self.stdout.write(f"{len(guids)}/{count} products")
+        return guids
+
+    def create_likes(self, count, users, products):
+        def build(i):
+            return ProductLike(guid=self.guid(), product_id=self.rng.choice(products), user_id=self.rng.choice(users))
+
+        # Duplicate (user, product) pairs are dropped by the unique constraint.
+        for rows in self.batched(count, build):
+            self.bulk_insert(ProductLike, rows)
+        self.stdout.write(f"{count} likes attempted")
+
+    def create_ratings(self, count, users, products):
+        # One rating per (user, product), so recompute_ratings yields realistic averages.
+        count = min(count, len(users) * len(products))
+        rated = set()
+
+        def build(i):
+            while True:
+                pair = (self.rng.choice(products), self.rng.choice(users))
+                if pair not in rated:
+                    rated.add(pair)
+                    break
+            return ProductRating(
+                guid=self.guid(),
+                product_id=pair[0],
+                user_id=pair[1],
+                rating=self.rng.choices([1, 2, 3, 4, 5], [5, 5, 15, 35, 40])[0],
+                state=ModelStateChoices.APPROVED,
+            )
+
+        for rows in self.batched(count, build):
+            self.bulk_insert(ProductRating, rows)
+        self.stdout.write(f"{count} ratings")
+
+    def create_comments(self, count, reply_ratio, users, products):
+        """
+        Comment threads with paths assigned in memory, since bulk_create skips ``save()``.
+
+        Replies pick a parent from the same batch, so parents are always inserted first.
+        """
+        started = timezone.now()
+        for start in range(0, count, self.batch_size):
+            rows = []
+            for i in range(start, min(start + self.batch_size, count)):
+                parent = self.rng.choice(rows) if rows and self.rng.random() < reply_ratio else None
+                comment = ProductComment(
+                    guid=self.guid(),
+                    product_id=parent.product_id if parent else self.rng.choice(products),
+                    user_id=self.rng.choice(users),
+                    reply=parent,
+                    comment=self.sentence(self.rng.randint(3, 20)),
+                    state=ModelStateChoices.APPROVED,
+                )
+                # Path segments only need to order siblings the way they were generated.
+                comment.created_at = started + timedelta(microseconds=i)
+                comment.assign_thread_path()
+                rows.append(comment)
+            self.bulk_insert(ProductComment, rows)
+        self.stdout.write(f"{count} comments")
+
+    def finish(self):
+        """Fill the denormalized columns that bulk_create bypassed, one statement each."""
+        refresh_primary_images(Product.admin_objects.all())
+        recompute_ratings(Product.admin_objects.all())
+        if is_supported():
+            call_command("rebuild_search_vectors", stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS("Catalog seeded"))
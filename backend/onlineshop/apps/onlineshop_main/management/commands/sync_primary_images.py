@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.onlineshop_main.images import refresh_primary_images
+from apps.onlineshop_main.models import Product
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized primary image of every product"
+
+    def handle(self, *args, **options):
+        updated = refresh_primary_images(Product.admin_objects.all())
+        self.stdout.write(self.style.SUCCESS(f"Primary images synced for {updated} products"))
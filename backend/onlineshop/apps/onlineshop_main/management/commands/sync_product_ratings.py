@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.onlineshop_main.models import Product
+from apps.onlineshop_main.ratings import recompute_ratings
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored rating average and count of every product"
+
+    def handle(self, *args, **options):
+        updated = recompute_ratings(Product.admin_objects.all())
+        self.stdout.write(self.style.SUCCESS(f"Ratings synced for {updated} products"))
@@ -0,0 +1,230 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:47
+
+import apps.onlineshop_main.mixins
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+import django.core.validators
+import django.db.models.deletion
+import django.db.models.functions.comparison
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The gin_trgm_ops indexes below need pg_trgm; a no-op on other databases.
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('title', models.CharField(max_length=256)),
+                ('meta', models.SlugField(max_length=256, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Category',
+                'verbose_name_plural': 'Categories',
+                'db_table': 'onlineshop_app__categories',
+                'ordering': ('-created_at',),
+            },
+            bases=(apps.onlineshop_main.mixins.AutoSlugMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('title', models.CharField(max_length=256)),
+                ('meta', models.SlugField(max_length=256, unique=True)),
+                ('short_description', models.TextField(max_length=250)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=26)),
+                ('price_discount', models.DecimalField(blank=True, decimal_places=2, max_digits=26, null=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('rating_avg', models.FloatField(default=0, editable=False)),
+                ('rating_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_category_products', to='onlineshop_main.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_user_products', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Product',
+                'verbose_name_plural': 'Products',
+                'db_table': 'onlineshop_app__products',
+                'ordering': ('-created_at',),
+            },
+            bases=(apps.onlineshop_main.mixins.AutoSlugMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='ProductImage',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('image', models.ImageField(upload_to='products/')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_product_images', to='onlineshop_main.product')),
+            ],
+            options={
+                'verbose_name': 'Product Image',
+                'verbose_name_plural': 'Product Images',
+                'db_table': 'onlineshop_app__product_images',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='onlineshop_main.productimage'),
+        ),
+        migrations.CreateModel(
+            name='ProductLike',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_product_likes', to='onlineshop_main.product')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_user_likes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Product Like',
+                'verbose_name_plural': 'Product Likes',
+                'db_table': 'onlineshop_app__product_likes',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductRating',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('rating', models.FloatField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(5)])),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_product_ratings', to='onlineshop_main.product')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_user_ratings', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Product Rating',
+                'verbose_name_plural': 'Product Ratings',
+                'db_table': 'onlineshop_app__product_ratings',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSellDocument',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('is_seller_agree', models.BooleanField(default=False)),
+                ('is_buyer_agree', models.BooleanField(default=False)),
+                ('buyer_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_products_bought', to=settings.AUTH_USER_MODEL)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_sell_documents', to='onlineshop_main.product')),
+                ('seller_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_products_sold', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Product Sell Document',
+                'verbose_name_plural': 'Product Sell Documents',
+                'db_table': 'onlineshop_app__product_sell_documents',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductComment',
+            fields=[
+                ('guid', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('is_banned', models.BooleanField(default=False)),
+                ('state', models.CharField(choices=[('moderation', 'Moderatsiya jarayonida'), ('approved', 'Tasdiqlangan'), ('rejected', 'Rad etilgan'), ('banned', 'Ban qilingan'), ('hidden', 'Yashirilgan / ko‘rinmaydi')], max_length=12)),
+                ('depth', models.PositiveSmallIntegerField(default=0, editable=False)),
+                ('path', models.TextField(default='', editable=False)),
+                ('comment', models.TextField()),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_product_comments', to='onlineshop_main.product')),
+                ('reply', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_comment_replies', to='onlineshop_main.productcomment')),
+                ('root', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_thread', to='onlineshop_main.productcomment')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='onlineshop_app_user_comments', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Product Comment',
+                'verbose_name_plural': 'Product Comments',
+                'db_table': 'onlineshop_app__product_comments',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['root', 'path'], name='product_comment_thread_idx')],
+            },
+            bases=(apps.onlineshop_main.mixins.ThreadPathMixin, models.Model),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='product_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='product_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['state', '-created_at', '-guid'], name='product_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'state', '-created_at', '-guid'], name='product_category_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['state', 'price', 'guid'], name='product_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'state', 'price', 'guid'], name='product_category_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(models.F('state'), django.db.models.functions.comparison.Coalesce('price_discount', 'price'), models.F('guid'), name='product_eff_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(models.F('category'), models.F('state'), django.db.models.functions.comparison.Coalesce('price_discount', 'price'), models.F('guid'), name='product_category_eff_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['state', '-rating_avg', '-rating_count', '-guid'], name='product_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'state', '-rating_avg', '-rating_count', '-guid'], name='product_category_rating_idx'),
+        ),
+    ]
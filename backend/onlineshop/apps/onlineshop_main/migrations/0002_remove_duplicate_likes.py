@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("onlineshop_main", "0001_initial"),
+    ]
+
+    operations = [
+        # Keep the oldest like per (product, user) so product_like_unique can be added.
+        migrations.RunSQL(
+            """
+            DELETE FROM onlineshop_app__product_likes WHERE guid IN (
+                SELECT guid FROM (
+                    SELECT guid, ROW_NUMBER() OVER (
+                        PARTITION BY product_id, user_id ORDER BY created_at, guid
+                    ) AS position
+                    FROM onlineshop_app__product_likes
+                ) ranked
+                WHERE position > 1
+            )
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("onlineshop_main", "0002_remove_duplicate_likes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="productlike",
+            constraint=models.UniqueConstraint(fields=("product", "user"), name="product_like_unique"),
+        ),
+    ]
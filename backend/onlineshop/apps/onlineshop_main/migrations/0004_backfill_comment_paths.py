@@ -0,0 +1,42 @@
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def path_segment(comment):
+    # Frozen copy of ThreadPathMixin.path_segment.
+    return f"{int(comment.created_at.timestamp() * 1_000_000):017d}-{comment.pk.hex[:8]}"
+
+
+def backfill_comment_paths(apps, schema_editor):
+    """Fill root, depth and path for comments written before threads were materialized, parents first."""
+    ProductComment = apps.get_model("onlineshop_main", "ProductComment")
+
+    parents = {}
+    level = list(ProductComment.objects.filter(reply__isnull=True).order_by("created_at"))
+    while level:
+        for comment in level:
+            parent = parents.get(comment.reply_id)
+            if parent is None:
+                comment.root_id = comment.pk
+                comment.depth = 0
+                comment.path = path_segment(comment)
+            else:
+                comment.root_id = parent.root_id
+                comment.depth = parent.depth + 1
+                comment.path = f"{parent.path}/{path_segment(comment)}"
+        ProductComment.objects.bulk_update(level, ["root", "depth", "path"], batch_size=BATCH_SIZE)
+
+        parents = {comment.pk: comment for comment in level}
+        level = list(ProductComment.objects.filter(reply__in=list(parents)).order_by("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("onlineshop_main", "0003_productlike_product_like_unique"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_comment_paths, migrations.RunPython.noop),
+    ]
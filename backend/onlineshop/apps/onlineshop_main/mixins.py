@@ -1,3 +1,4 @@
+from django.utils import timezone
 from django.utils.text import slugify
 
 
@@ -19,3 +20,36 @@ class AutoSlugMixin:
         if not getattr(self, self.slug_field):
             setattr(self, self.slug_field, self.generate_unique_slug())
         super().save(*args, **kwargs)  # type: ignore
+
+
+class ThreadPathMixin:
+    """
+    Maintain ``root``, ``depth`` and a materialized ``path`` for self-referencing threads.
+
+    Each path segment is a fixed-width creation timestamp plus a guid prefix, so
+    ordering by ``path`` lists a thread depth-first with siblings oldest first.
+    """
+
+    parent_field = "reply"
+    path_separator = "/"
+
+    def path_segment(self):
+        created_at = getattr(self, "created_at", None) or timezone.now()
+        return f"{int(created_at.timestamp() * 1_000_000):017d}-{self.pk.hex[:8]}"
+
+    def assign_thread_path(self):
+        """Fill ``root``, ``depth`` and ``path`` from the parent; also used before ``bulk_create``."""
+        parent = getattr(self, self.parent_field)
+        if parent is None:
+            self.root_id = self.pk
+            self.depth = 0
+            self.path = self.path_segment()
+        else:
+            self.root_id = parent.root_id or parent.pk
+            self.depth = parent.depth + 1
+            self.path = f"{parent.path}{self.path_separator}{self.path_segment()}"
+
+    def save(self, *args, **kwargs):
+        if not self.path:
+            self.assign_thread_path()
+        super().save(*args, **kwargs)  # type: ignore
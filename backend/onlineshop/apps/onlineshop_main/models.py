@@ -1,9 +1,12 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Coalesce
 
 from .base_model import BaseModel
 from .managers import ModelManager
-from .mixins import AutoSlugMixin
+from .mixins import AutoSlugMixin, ThreadPathMixin
 
 
 class Category(AutoSlugMixin, BaseModel):
@@ -32,18 +35,60 @@ class Product(AutoSlugMixin, BaseModel):
     description = models.TextField(null=True, blank=True)
     price = models.DecimalField(max_digits=26, decimal_places=2)
     price_discount = models.DecimalField(max_digits=26, decimal_places=2, null=True, blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Maintained incrementally by apps.onlineshop_main.ratings; never aggregated per request.
+    rating_avg = models.FloatField(default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    # Newest image, kept in sync by apps.onlineshop_main.signals so lists can select_related it.
+    primary_image = models.ForeignKey(
+        "ProductImage", on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="+"
+    )
 
     objects = ModelManager()
     admin_objects = models.Manager()
 
+    # Written only by their own UPDATE statements, never by save().
+    DERIVED_FIELDS = ("rating_avg", "rating_count", "primary_image")
+
     def __str__(self):
         return f"{self.title} - {self.user} {'✅' if self.is_active else '❌'}"
 
+    def save(self, *args, **kwargs):
+        # An instance loaded before a new image or rating would otherwise write the old values back.
+        if not self._state.adding and not args and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DERIVED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = "Product"
         verbose_name_plural = "Products"
         db_table = "onlineshop_app__products"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(fields=["search_vector"], name="product_search_vector_idx"),
+            GinIndex(fields=["title"], name="product_title_trgm_idx", opclasses=["gin_trgm_ops"]),
+            # One composite index per browse sort mode (see apps.onlineshop_main.pagination.SORT_MODES).
+            models.Index(fields=["state", "-created_at", "-guid"], name="product_feed_idx"),
+            models.Index(fields=["category", "state", "-created_at", "-guid"], name="product_category_feed_idx"),
+            models.Index(fields=["state", "price", "guid"], name="product_price_idx"),
+            models.Index(fields=["category", "state", "price", "guid"], name="product_category_price_idx"),
+            models.Index("state", Coalesce("price_discount", "price"), "guid", name="product_eff_price_idx"),
+            models.Index(
+                "category",
+                "state",
+                Coalesce("price_discount", "price"),
+                "guid",
+                name="product_category_eff_price_idx",
+            ),
+            models.Index(fields=["state", "-rating_avg", "-rating_count", "-guid"], name="product_rating_idx"),
+            models.Index(
+                fields=["category", "state", "-rating_avg", "-rating_count", "-guid"], name="product_category_rating_idx"
+            ),
+        ]
 
 
 class ProductImage(BaseModel):
@@ -85,6 +130,9 @@ class ProductLike(BaseModel):
         verbose_name = "Product Like"
         verbose_name_plural = "Product Likes"
         db_table = "onlineshop_app__product_likes"
+        constraints = [
+            models.UniqueConstraint(fields=["product", "user"], name="product_like_unique"),
+        ]
 
 
 class ProductSellDocument(BaseModel):
@@ -103,10 +151,15 @@ class ProductSellDocument(BaseModel):
         db_table = "onlineshop_app__product_sell_documents"
 
 
-class ProductComment(BaseModel):
+class ProductComment(ThreadPathMixin, BaseModel):
     reply = models.ForeignKey(
         "self", on_delete=models.CASCADE, null=True, blank=True, related_name="onlineshop_app_comment_replies"
     )
+    root = models.ForeignKey(
+        "self", on_delete=models.CASCADE, null=True, blank=True, editable=False, related_name="onlineshop_app_thread"
+    )
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+    path = models.TextField(default="", editable=False)
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="onlineshop_app_product_comments")
     user = models.ForeignKey("users.UserModel", on_delete=models.CASCADE, related_name="onlineshop_app_user_comments")
     comment = models.TextField()
@@ -119,3 +172,6 @@ class ProductComment(BaseModel):
         verbose_name_plural = "Product Comments"
         db_table = "onlineshop_app__product_comments"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["root", "path"], name="product_comment_thread_idx"),
+        ]
@@ -0,0 +1,120 @@
+import base64
+import binascii
+import json
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .search import with_effective_price
+
+# Every mode ends on guid so each row has a unique position; Product.Meta.indexes mirrors these.
+SORT_MODES = {
+    "newest": ("-created_at", "-guid"),
+    "price": ("price", "guid"),
+    "-price": ("-price", "-guid"),
+    "effective_price": ("effective_price", "guid"),
+    "-effective_price": ("-effective_price", "-guid"),
+    "rating": ("-rating_avg", "-rating_count", "-guid"),
+}
+DEFAULT_SORT = "newest"
+
+
+def sort_products(queryset, mode):
+    if mode not in SORT_MODES:
+        raise ValidationError({"sort": f"Unknown sort mode, expected one of: {', '.join(SORT_MODES)}"})
+    if "effective_price" in mode:
+        queryset = with_effective_price(queryset)
+    return queryset.order_by(*SORT_MODES[mode])
+
+
+class ProductKeysetPagination(BasePagination):
+    """
+    Keyset pagination for sorted product lists: no COUNT(*) and no OFFSET, however deep the scroll.
+
+    The opaque cursor holds the sort key of the last row served, and the next page
+    is read from the matching composite index starting right after it.
+    """
+
+    page_size = 16
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    @staticmethod
+    def is_requested(request):
+        return request.query_params.get("mode") == "cursor"
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.model = queryset.model
+        self.ordering = list(queryset.query.order_by)
+        page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.after(position))
+
+        rows = list(queryset[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_position = [getattr(rows[-1], name.lstrip("-")) for name in self.ordering] if self.has_next else None
+        return rows
+
+    def after(self, position):
+        """Rows strictly past ``position`` in the current ordering."""
+        keys = [(name.lstrip("-"), name.startswith("-")) for name in self.ordering]
+        clauses, equal = [], Q()
+        for (field, descending), value in zip(keys, position):
+            clauses.append(equal & Q(**{f"{field}__{'lt' if descending else 'gt'}": value}))
+            equal &= Q(**{field: value})
+
+        # The redundant bound on the leading key lets the index scan start at the cursor.
+        field, descending = keys[0]
+        return Q(**{f"{field}__{'lte' if descending else 'gte'}": position[0]}) & reduce(or_, clauses)
+
+    def _to_python(self, name, value):
+        field = name.lstrip("-")
+        if field == "effective_price":
+            return Decimal(value)
+        return self.model._meta.get_field(field).to_python(value)
+
+    def encode_cursor(self, position):
+        token = json.dumps({"o": self.ordering, "p": position}, default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(token.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            token = json.loads(base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)))
+            # A cursor only makes sense for the sort it was issued for.
+            if token["o"] != self.ordering or len(token["p"]) != len(self.ordering):
+                raise ValueError
+            return [self._to_python(name, value) for name, value in zip(self.ordering, token["p"])]
+        except (binascii.Error, ValueError, TypeError, KeyError, ArithmeticError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
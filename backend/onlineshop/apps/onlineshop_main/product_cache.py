@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "onlineshop:product:{guid}:version"
+PAYLOAD_KEY = "onlineshop:product:{guid}:{version}:{kind}"
+PAYLOAD_TIMEOUT = 60 * 60 * 24 * 30
+
+
+def _bump(key):
+    cache.add(key, 0, timeout=None)
+    cache.incr(key)
+
+
+def bump_product_version(guid):
+    """
+    Make every cached payload of one product unreachable; stale entries simply expire.
+
+    The bump waits for the surrounding transaction to commit, so a request in
+    between cannot cache the old row under the new version.
+    """
+    key = VERSION_KEY.format(guid=guid)
+    transaction.on_commit(lambda: _bump(key))
+
+
+def cached_product_payload(guid, kind, build):
+    """
+    Serve ``build()`` for one product from the cache under its current version.
+
+    ``kind`` separates the payloads of different endpoints; a ``None`` result
+    (product not found) is returned without being cached.
+    """
+    version = cache.get(VERSION_KEY.format(guid=guid), 0)
+    key = PAYLOAD_KEY.format(guid=guid, version=version, kind=kind)
+
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        if payload is not None:
+            cache.set(key, payload, timeout=PAYLOAD_TIMEOUT)
+    return payload
+
+
+def cached_product_payloads(guids, kind, build_many):
+    """
+    Batch form of ``cached_product_payload``: two cache round trips for any number of products.
+
+    ``build_many`` receives the guids that missed and returns ``{guid: payload}``
+    for the ones that exist. The result maps every found guid to its payload.
+    """
+    guids = [str(guid) for guid in dict.fromkeys(guids)]
+    versions = cache.get_many([VERSION_KEY.format(guid=guid) for guid in guids])
+    keys = {
+        guid: PAYLOAD_KEY.format(guid=guid, version=versions.get(VERSION_KEY.format(guid=guid), 0), kind=kind)
+        for guid in guids
+    }
+
+    cached = cache.get_many(list(keys.values()))
+    payloads = {guid: cached[key] for guid, key in keys.items() if key in cached}
+
+    missing = [guid for guid in guids if guid not in payloads]
+    if missing:
+        built = {str(guid): payload for guid, payload in build_many(missing).items()}
+        cache.set_many({keys[guid]: payload for guid, payload in built.items()}, timeout=PAYLOAD_TIMEOUT)
+        payloads.update(built)
+    return payloads
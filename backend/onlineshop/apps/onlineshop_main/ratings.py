@@ -0,0 +1,56 @@
+from django.db.models import Avg, Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Product, ProductRating
+from .product_cache import bump_product_version
+
+
+def _products(product_id):
+    return Product.admin_objects.filter(pk=product_id)
+
+
+def _rated(products, product_id, **values):
+    # updated_at moves with the ratings so conditional GETs and cached payloads see the change.
+    products.update(updated_at=timezone.now(), **values)
+    bump_product_version(product_id)
+
+
+def add_rating(product_id, rating):
+    # Every F() on the right-hand side reads the row before the UPDATE, so this is one atomic step.
+    _rated(
+        _products(product_id),
+        product_id,
+        rating_avg=(F("rating_avg") * F("rating_count") + rating) / (F("rating_count") + 1),
+        rating_count=F("rating_count") + 1,
+    )
+
+
+def remove_rating(product_id, rating):
+    _rated(
+        _products(product_id),
+        product_id,
+        rating_avg=Case(
+            When(rating_count__lte=1, then=Value(0.0)),
+            default=(F("rating_avg") * F("rating_count") - rating) / (F("rating_count") - 1),
+        ),
+        rating_count=Case(When(rating_count__lte=1, then=Value(0)), default=F("rating_count") - 1),
+    )
+
+
+def change_rating(product_id, old_rating, new_rating):
+    _rated(
+        _products(product_id).filter(rating_count__gt=0),
+        product_id,
+        rating_avg=F("rating_avg") + (new_rating - old_rating) / F("rating_count"),
+    )
+
+
+def recompute_ratings(products):
+    """Rebuild ``rating_avg`` and ``rating_count`` from the ratings table in one UPDATE."""
+    ratings = ProductRating.objects.filter(product=OuterRef("pk")).order_by().values("product")
+    return products.update(
+        updated_at=timezone.now(),
+        rating_avg=Coalesce(Subquery(ratings.annotate(avg=Avg("rating")).values("avg")), 0.0),
+        rating_count=Coalesce(Subquery(ratings.annotate(count=Count("pk")).values("count")), 0),
+    )
@@ -0,0 +1,164 @@
+import bisect
+import math
+from collections import defaultdict
+
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+from django_redis import get_redis_connection
+
+from .models import Product, ProductLike
+
+RELATED_KEY = "onlineshop:related:{guid}"
+RELATED_SIZE = 12
+# Lists written per MULTI/EXEC, so one rebuild never blocks Redis for long.
+WRITE_BATCH = 500
+# Same-category candidates are the products closest in price, not the whole category.
+PRICE_NEIGHBOURS = 40
+# Users who liked more than this many products say little about any pair of them.
+MAX_LIKES_PER_USER = 100
+# Co-liked products kept per product; enough to fill a list next to the category and price candidates.
+CO_LIKE_LIMIT = RELATED_SIZE * 2
+
+CO_LIKE_WEIGHT = 3.0
+CATEGORY_WEIGHT = 1.0
+PRICE_WEIGHT = 1.0
+# Prices further apart than this factor get no price-band bonus.
+PRICE_BAND = 2.0
+
+
+def _price(row):
+    return float(row["price_discount"] or row["price"] or 0)
+
+
+def _price_similarity(a, b):
+    if a <= 0 or b <= 0:
+        return 0.0
+    return max(0.0, 1 - abs(math.log(a / b)) / math.log(PRICE_BAND))
+
+
+def co_like_counts(category_id, limit=CO_LIKE_LIMIT):
+    """
+    For every liked product of ``category_id``: the ``limit`` products most often liked by the same users.
+
+    Pairs are counted in the database with a self-join on the likes table,
+    ranked per product and cut to ``limit``, so only the top pairs are loaded.
+    """
+    light_users = (
+        ProductLike.objects.order_by()
+        .values("user")
+        .annotate(likes=Count("pk"))
+        .filter(likes__lte=MAX_LIKES_PER_USER)
+        .values("user")
+    )
+    pairs = (
+        ProductLike.objects.filter(product__category_id=category_id, user__in=light_users)
+        .annotate(other=F("user__onlineshop_app_user_likes__product"))
+        .exclude(other=F("product"))
+        .order_by()
+        .values("product", "other")
+        .annotate(shared=Count("pk"))
+        .annotate(
+            position=Window(RowNumber(), partition_by=[F("product")], order_by=[F("shared").desc(), F("other").asc()])
+        )
+        .filter(position__lte=limit)
+    )
+
+    counts = defaultdict(dict)
+    for row in pairs.iterator():
+        counts[str(row["product"])][str(row["other"])] = row["shared"]
+    return counts
+
+
+def _price_rows(queryset):
+    return {
+        str(row["guid"]): row
+        for row in queryset.order_by().values("guid", "category_id", "price", "price_discount").iterator()
+    }
+
+
+def _rows_for(guids):
+    rows = {}
+    guids = sorted(guids)
+    for start in range(0, len(guids), WRITE_BATCH):
+        rows.update(_price_rows(Product.objects.filter(guid__in=guids[start : start + WRITE_BATCH])))
+    return rows
+
+
+def compute_related(size=RELATED_SIZE):
+    """
+    Yield every product with its top ``size`` neighbours by co-likes, category and price band.
+
+    Works one category at a time: its products, their co-likes and the
+    co-liked products from other categories are all that is held in memory.
+    """
+    categories = list(Product.objects.order_by().values_list("category_id", flat=True).distinct())
+    for category_id in categories:
+        rows = _price_rows(Product.objects.filter(category_id=category_id))
+        co_likes = co_like_counts(category_id)
+        outside = {other for others in co_likes.values() for other in others} - rows.keys()
+        known = {**rows, **_rows_for(outside)}
+
+        siblings = sorted((_price(row), guid) for guid, row in rows.items())
+        for guid, row in rows.items():
+            price = _price(row)
+            middle = bisect.bisect_left(siblings, (price, guid))
+            nearby = siblings[max(0, middle - PRICE_NEIGHBOURS // 2) : middle + PRICE_NEIGHBOURS // 2 + 1]
+
+            shared = co_likes.get(guid, {})
+            candidates = {other for _, other in nearby} | set(shared)
+            candidates.discard(guid)
+
+            scores = {}
+            for other in candidates:
+                other_row = known.get(other)
+                if other_row is None:
+                    continue
+                scores[other] = (
+                    CO_LIKE_WEIGHT * shared.get(other, 0)
+                    + CATEGORY_WEIGHT * (other_row["category_id"] == row["category_id"])
+                    + PRICE_WEIGHT * _price_similarity(price, _price(other_row))
+                )
+            yield guid, sorted(scores, key=scores.get, reverse=True)[:size]
+
+
+def _write_lists(redis, items):
+    pipe = redis.pipeline()
+    for guid, others in items:
+        key = RELATED_KEY.format(guid=guid)
+        pipe.delete(key)
+        if others:
+            pipe.rpush(key, *others)
+    pipe.execute()
+
+
+def build_related_index(size=RELATED_SIZE):
+    """
+    Replace every stored list and drop those of products that are gone or no longer public.
+
+    Each list is deleted and refilled inside one MULTI/EXEC, so readers never
+    see it empty or half written.
+    """
+    redis = get_redis_connection("default")
+    current, batch = set(), []
+    for guid, others in compute_related(size):
+        current.add(RELATED_KEY.format(guid=guid).encode())
+        batch.append((guid, others))
+        if len(batch) >= WRITE_BATCH:
+            _write_lists(redis, batch)
+            batch = []
+    if batch:
+        _write_lists(redis, batch)
+
+    stale = [key for key in redis.scan_iter(match=RELATED_KEY.format(guid="*"), count=1000) if key not in current]
+    for start in range(0, len(stale), WRITE_BATCH):
+        redis.delete(*stale[start : start + WRITE_BATCH])
+    return len(current)
+
+
+def forget_related(guid):
+    get_redis_connection("default").delete(RELATED_KEY.format(guid=guid))
+
+
+def related_ids(product, limit):
+    ids = get_redis_connection("default").lrange(RELATED_KEY.format(guid=product.pk), 0, limit - 1)
+    return [guid.decode() for guid in ids]
@@ -0,0 +1,92 @@
+from decimal import Decimal
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db import connection
+from django.db.models import Count, DecimalField, F, Max, Min, Q, Value
+from django.db.models.functions import Coalesce, Floor, Least
+
+# Titles and descriptions are mostly Uzbek, which has no Postgres stemmer, so vectors are built without one.
+SEARCH_CONFIG = "simple"
+HEADLINE_OPTIONS = {"start_sel": "<mark>", "stop_sel": "</mark>", "max_fragments": 2}
+HISTOGRAM_BUCKETS = 10
+
+
+def is_supported():
+    return connection.vendor == "postgresql"
+
+
+def product_vector(category_title):
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Value(category_title or ""), weight="B", config=SEARCH_CONFIG)
+        + SearchVector("short_description", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def update_product_vectors(queryset, category_title):
+    if is_supported():
+        queryset.update(search_vector=product_vector(category_title))
+
+
+def search_products(queryset, q):
+    """Ranked full-text matches, falling back to trigram similarity on the title for typos."""
+    query = SearchQuery(q, search_type="websearch", config=SEARCH_CONFIG)
+    rank = Coalesce(SearchRank(F("search_vector"), query), 0.0) + TrigramSimilarity("title", q)
+    return (
+        queryset.annotate(
+            rank=rank,
+            headline=SearchHeadline("short_description", query, config=SEARCH_CONFIG, **HEADLINE_OPTIONS),
+        )
+        .filter(Q(search_vector=query) | Q(title__trigram_similar=q))
+        .order_by("-rank", "-created_at")
+    )
+
+
+def with_effective_price(queryset):
+    """Annotate the price a buyer pays: the discount price when there is one."""
+    if "effective_price" in queryset.query.annotations:
+        return queryset
+    return queryset.annotate(
+        effective_price=Coalesce("price_discount", "price", output_field=DecimalField(max_digits=26, decimal_places=2))
+    )
+
+
+def category_facets(queryset):
+    rows = (
+        queryset.order_by()
+        .values("category__guid", "category__title", "category__meta")
+        .annotate(count=Count("pk"))
+        .order_by("-count", "category__title")
+    )
+    return [
+        {"guid": row["category__guid"], "title": row["category__title"], "meta": row["category__meta"], "count": row["count"]}
+        for row in rows
+    ]
+
+
+def price_histogram(queryset, buckets=HISTOGRAM_BUCKETS):
+    """Equal-width buckets between the cheapest and the dearest effective price."""
+    queryset = with_effective_price(queryset.order_by())
+    bounds = queryset.aggregate(low=Min("effective_price"), high=Max("effective_price"))
+    low, high = bounds["low"], bounds["high"]
+    if low is None:
+        return {"min": None, "max": None, "buckets": []}
+
+    width = (high - low) / buckets or Decimal(1)
+    rows = (
+        queryset.annotate(
+            bucket=Least(Floor((F("effective_price") - low) / width), Value(buckets - 1), output_field=DecimalField())
+        )
+        .values("bucket")
+        .annotate(count=Count("pk"))
+    )
+    counts = {int(row["bucket"]): row["count"] for row in rows}
+    return {
+        "min": low,
+        "max": high,
+        "buckets": [
+            {"min": low + width * index, "max": low + width * (index + 1), "count": counts.get(index, 0)}
+            for index in range(buckets)
+        ],
+    }
@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 
 class OnlineShopStatisticsSerializer(serializers.Serializer):
+    created_at = serializers.DateTimeField(read_only=True)
     total_products = serializers.IntegerField()
     total_sold = serializers.IntegerField()
     category_stats = serializers.DictField(child=serializers.IntegerField())
@@ -0,0 +1,72 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .images import refresh_primary_images
+from .models import Category, Product, ProductImage, ProductRating
+from .product_cache import bump_product_version
+from .ratings import add_rating, change_rating, remove_rating
+from .related import forget_related
+from .search import update_product_vectors
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def sync_primary_image(sender, instance, **kwargs):
+    refresh_primary_images(Product.admin_objects.filter(pk=instance.product_id))
+    bump_product_version(instance.product_id)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product_payloads(sender, instance, **kwargs):
+    bump_product_version(instance.pk)
+
+
+@receiver(post_delete, sender=Product)
+def drop_related_products(sender, instance, **kwargs):
+    forget_related(instance.pk)
+
+
+# The fields product_vector reads; saves limited to other fields leave the vector as it is.
+SEARCH_VECTOR_FIELDS = {"title", "short_description", "description", "category", "category_id"}
+
+
+@receiver(post_save, sender=Product)
+def update_product_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not SEARCH_VECTOR_FIELDS & set(update_fields):
+        return
+    update_product_vectors(Product.admin_objects.filter(pk=instance.pk), instance.category.title)
+
+
+@receiver(pre_save, sender=Category)
+def remember_category_title(sender, instance, **kwargs):
+    instance._previous_title = Category.admin_objects.filter(pk=instance.pk).values_list("title", flat=True).first()
+
+
+@receiver(post_save, sender=Category)
+def update_category_product_search_vectors(sender, instance, created, **kwargs):
+    # The title is the only category field in the product vector.
+    if not created and instance.title != getattr(instance, "_previous_title", None):
+        update_product_vectors(Product.admin_objects.filter(category=instance), instance.title)
+
+
+@receiver(pre_save, sender=ProductRating)
+def remember_previous_rating(sender, instance, **kwargs):
+    instance._previous = ProductRating.objects.filter(pk=instance.pk).values("product_id", "rating").first()
+
+
+@receiver(post_save, sender=ProductRating)
+def apply_rating(sender, instance, **kwargs):
+    previous = getattr(instance, "_previous", None)
+    if previous is None:
+        add_rating(instance.product_id, instance.rating)
+    elif previous["product_id"] != instance.product_id:
+        remove_rating(previous["product_id"], previous["rating"])
+        add_rating(instance.product_id, instance.rating)
+    elif previous["rating"] != instance.rating:
+        change_rating(instance.product_id, previous["rating"], instance.rating)
+
+
+@receiver(post_delete, sender=ProductRating)
+def withdraw_rating(sender, instance, **kwargs):
+    remove_rating(instance.product_id, instance.rating)
@@ -0,0 +1,134 @@
+import os
+import uuid
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from .images import refresh_primary_images
+from .models import Product, ProductImage
+from .product_cache import bump_product_version
+
+PENDING_KEY = "onlineshop:uploads:{user}"
+# Presigned uploads get their own prefix so stale ones can be listed without walking every image.
+UPLOAD_PREFIX = "products/uploads/"
+UPLOAD_URL_EXPIRES = timedelta(minutes=15)
+# Issued keys the user has not finalized are forgotten after this long.
+PENDING_TTL = 60 * 60
+# Unattached uploads older than this can no longer be finalized and are purged.
+STALE_UPLOAD_AGE = timedelta(days=1)
+PURGE_BATCH = 1000
+MAX_FILES_PER_REQUEST = 10
+MAX_IMAGE_SIZE = 10 * 1024 * 1024
+ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "webp"}
+
+
+class UploadError(Exception):
+    pass
+
+
+def _storage():
+    return ProductImage._meta.get_field("image").storage
+
+
+def supports_direct_uploads():
+    return hasattr(_storage(), "client")
+
+
+def issue_upload_urls(user, filenames):
+    """Reserve an object key per file under ``UPLOAD_PREFIX`` and presign a PUT for each one."""
+    if not supports_direct_uploads():
+        raise UploadError("Direct uploads are not available")
+    if not filenames or len(filenames) > MAX_FILES_PER_REQUEST:
+        raise UploadError(f"Between 1 and {MAX_FILES_PER_REQUEST} files can be uploaded at once")
+
+    storage = _storage()
+    # Sign against the public endpoint when the storage has one, so browsers can reach the URL.
+    client = getattr(storage, "base_url_client", storage.client)
+
+    uploads = []
+    for filename in filenames:
+        ext = os.path.splitext(str(filename))[1].lstrip(".").lower()
+        if ext not in ALLOWED_EXTENSIONS:
+            raise UploadError(f"Unsupported image type: {filename}")
+        key = f"{UPLOAD_PREFIX}{uuid.uuid4().hex}.{ext}"
+        url = client.presigned_put_object(storage.bucket_name, key, expires=UPLOAD_URL_EXPIRES)
+        uploads.append({"key": key, "url": url})
+
+    redis = get_redis_connection("default")
+    pending = PENDING_KEY.format(user=user.pk)
+    pipe = redis.pipeline()
+    pipe.sadd(pending, *[upload["key"] for upload in uploads])
+    pipe.expire(pending, PENDING_TTL)
+    pipe.execute()
+    return uploads
+
+
+def finalize_uploads(user, product, keys):
+    """
+    Attach uploaded objects to ``product`` with one bulk insert.
+
+    Only keys issued to ``user`` that exist in storage and are within the size
+    limit are attached; oversized objects are removed from storage. A key can
+    be attached once.
+    """
+    keys = list(dict.fromkeys(str(key) for key in keys))
+    redis = get_redis_connection("default")
+    pending = PENDING_KEY.format(user=user.pk)
+
+    pipe = redis.pipeline()
+    for key in keys:
+        pipe.sismember(pending, key)
+    issued = [key for key, is_member in zip(keys, pipe.execute()) if is_member]
+
+    storage = _storage()
+    attached, rejected = [], []
+    for key in issued:
+        # Not uploaded yet: the key stays reserved for a later finalize call.
+        if not storage.exists(key):
+            continue
+        if storage.size(key) > MAX_IMAGE_SIZE:
+            storage.delete(key)
+            rejected.append(key)
+            continue
+        attached.append(key)
+
+    if rejected:
+        redis.srem(pending, *rejected)
+    if attached:
+        # A rolled-back product keeps its keys reserved, so the upload can be retried.
+        transaction.on_commit(lambda: redis.srem(pending, *attached))
+
+    ProductImage.objects.bulk_create([ProductImage(product=product, image=key) for key in attached])
+    # bulk_create sends no post_save, so keep the denormalized primary image in step here.
+    refresh_primary_images(Product.admin_objects.filter(pk=product.pk))
+    bump_product_version(product.pk)
+    return attached
+
+
+def _delete_unattached(storage, names):
+    attached = set(ProductImage.objects.filter(image__in=names).values_list("image", flat=True))
+    stale = [name for name in names if name not in attached]
+    for name in stale:
+        storage.client.remove_object(storage.bucket_name, name)
+    return len(stale)
+
+
+def purge_stale_uploads(older_than=STALE_UPLOAD_AGE):
+    """Delete objects under ``UPLOAD_PREFIX`` that no ProductImage points at and that are older than ``older_than``."""
+    if not supports_direct_uploads():
+        return 0
+
+    storage = _storage()
+    cutoff = timezone.now() - older_than
+    purged, batch = 0, []
+    for obj in storage.client.list_objects(storage.bucket_name, prefix=UPLOAD_PREFIX, recursive=True):
+        if obj.last_modified and obj.last_modified < cutoff:
+            batch.append(obj.object_name)
+        if len(batch) >= PURGE_BATCH:
+            purged += _delete_unattached(storage, batch)
+            batch = []
+    if batch:
+        purged += _delete_unattached(storage, batch)
+    return purged